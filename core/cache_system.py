@@ -1 +1,45 @@
-# Sistema de caché para optimización
\ No newline at end of file
+"""
+Sistema de caché para optimización
+Cache de resultados compartido entre los nodos de un mismo grafo: dos nodos
+del mismo tipo cuyos inputs tienen la misma firma (mismos valores por defecto
+o mismas salidas de origen en la misma versión) reutilizan el mismo resultado
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import threading
+
+class ResultCache:
+    """
+    Cache LRU de resultados de compute(), segura entre hilos.
+    Cada NodeGraph tiene la suya y la vacía al quitar nodos o limpiarse.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Retorna el resultado cacheado para la clave, o None"""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is not None:
+                self._entries.move_to_end(key)
+            return results
+
+    def put(self, key: tuple, results: Dict[str, Any]):
+        """Guarda un resultado, descartando el menos usado si se llena"""
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Vacía el cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1 +1,60 @@
-# Registro de tipos de nodos
\ No newline at end of file
+"""
+Registro de tipos de nodos para GoboFlow
+Resuelve las clases de nodo de forma perezosa, importando su módulo
+solo la primera vez que se necesitan
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, Optional, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .node_system import Node
+
+# NODE_TYPE -> "modulo:Clase"
+NODE_REGISTRY: Dict[str, str] = {
+    # Parámetros
+    "number_parameter": "nodes.base.base_node:NumberParameterNode",
+    "vector_parameter": "nodes.base.base_node:VectorParameterNode",
+    "color_parameter": "nodes.base.base_node:ColorParameterNode",
+
+    # Primitivas
+    "circle": "nodes.primitives.circle_node:CircleNode",
+    "ring": "nodes.primitives.circle_node:RingNode",
+    "ellipse": "nodes.primitives.circle_node:EllipseNode",
+    "rectangle": "nodes.primitives.rectangle_node:RectangleNode",
+
+    # Operaciones y utilidades
+    "merge": "nodes.base.base_node:MergeNode",
+    "split": "nodes.base.base_node:SplitNode",
+    "info": "nodes.base.base_node:InfoNode",
+    "conditional": "nodes.base.base_node:ConditionalNode",
+    "random": "nodes.base.base_node:RandomNode",
+    "math": "nodes.base.base_node:MathNode",
+
+    # Salidas
+    "viewer": "nodes.base.base_node:ViewerNode",
+}
+
+def register_node_type(node_type: str, target: str):
+    """Registra un tipo de nodo como "modulo:Clase" sin importarlo"""
+    NODE_REGISTRY[node_type] = target
+    get_node_class.cache_clear()
+
+@lru_cache(maxsize=None)
+def get_node_class(node_type: str) -> Type['Node']:
+    """Obtiene la clase de un tipo de nodo, importando su módulo si es necesario"""
+    target = NODE_REGISTRY.get(node_type)
+    if target is None:
+        raise ValueError(f"Tipo de nodo no encontrado: {node_type}")
+
+    module_name, class_name = target.split(":")
+    return getattr(import_module(module_name), class_name)
+
+def create_node(node_type: str, title: Optional[str] = None) -> 'Node':
+    """Crea una instancia de nodo por su tipo"""
+    return get_node_class(node_type)(title)
+
+def get_registered_types() -> list:
+    """Retorna los tipos de nodo registrados (sin importarlos)"""
+    return list(NODE_REGISTRY)
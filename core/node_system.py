@@ -4,13 +4,26 @@ Define las clases fundamentales: Node, Socket, Connection
 """
 
 from typing import Dict, List, Any, Optional, Tuple, Set, Callable, TYPE_CHECKING
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+import threading
 import uuid
 from abc import ABC, abstractmethod
 
+from .cache_system import ResultCache
+
 if TYPE_CHECKING:
     from .socket_types import SocketType
 
+def _freeze(value: Any) -> Any:
+    """Convierte listas y diccionarios en tuplas para poder compararlos como clave"""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
 class SocketDirection(Enum):
     """Dirección de un socket"""
     INPUT = "input"
@@ -28,13 +41,22 @@ class Socket:
     Representa un punto de conexión en un nodo (entrada o salida)
     """
     
+    # Se incrementa con cada conexión creada o eliminada en cualquier socket;
+    # permite a NodeGraph saber si su orden de ejecución sigue vigente
+    topology_version = 0
+    
+    # Serializa los cambios de estructura (nodos y conexiones) frente a quien
+    # recorre el grafo desde otro hilo (ver NodeGraph.execute_parallel)
+    topology_lock = threading.RLock()
+    
     def __init__(self, 
                  node: 'Node',
                  socket_type: 'SocketType', 
                  direction: SocketDirection,
                  name: str,
                  default_value: Any = None,
-                 is_multi: bool = False):
+                 is_multi: bool = False,
+                 is_lazy: bool = False):
         self.id = str(uuid.uuid4())
         self.node = node
         self.socket_type = socket_type
@@ -42,6 +64,7 @@ class Socket:
         self.name = name
         self.default_value = default_value
         self.is_multi = is_multi  # Permite múltiples conexiones
+        self.is_lazy = is_lazy  # El nodo lo lee solo si lo necesita
         
         # Conexiones
         self.connections: List['Connection'] = []
@@ -96,15 +119,19 @@ class Socket:
         
     def add_connection(self, connection: 'Connection'):
         """Añade una conexión al socket"""
-        if connection not in self.connections:
-            self.connections.append(connection)
-            self.clear_cache()
+        with Socket.topology_lock:
+            if connection not in self.connections:
+                self.connections.append(connection)
+                self.clear_cache()
+                Socket.topology_version += 1
             
     def remove_connection(self, connection: 'Connection'):
         """Remueve una conexión del socket"""
-        if connection in self.connections:
-            self.connections.remove(connection)
-            self.clear_cache()
+        with Socket.topology_lock:
+            if connection in self.connections:
+                self.connections.remove(connection)
+                self.clear_cache()
+                Socket.topology_version += 1
 
 class Connection:
     """
@@ -144,6 +171,25 @@ class Node(ABC):
     NODE_CATEGORY = "base"
     NODE_DESCRIPTION = "Base node class"
     
+    # Nodos puros (salida determinada por sus inputs y su estado interno)
+    # pueden reutilizar el último resultado si nada de eso cambió
+    MEMOIZE_COMPUTE = False
+    
+    # Nodos deterministas cuyo resultado puede compartirse con cualquier otro
+    # nodo del mismo tipo y del mismo grafo cuyos inputs tengan la misma firma
+    CACHEABLE = False
+    
+    # Atributos propios en slots; __dict__ se conserva para los que añadan
+    # la UI o las subclases que no declaren sus propios __slots__
+    __slots__ = (
+        "__dict__", "__weakref__",
+        "id", "title", "state", "pos_x", "pos_y",
+        "input_sockets", "output_sockets",
+        "_output_cache", "_cache_valid", "_memo_key", "_memo_output",
+        "_compute_lock", "_dirty_generation", "_result_cache",
+        "on_state_changed", "on_value_changed",
+    )
+    
     def __init__(self, title: Optional[str] = None):
         self.id = str(uuid.uuid4())
         self.title = title or self.NODE_TITLE
@@ -161,6 +207,20 @@ class Node(ABC):
         self._output_cache: Dict[str, Any] = {}
         self._cache_valid = False
         
+        # Memoización por valor de inputs (ver MEMOIZE_COMPUTE)
+        self._memo_key: Optional[tuple] = None
+        self._memo_output: Optional[Dict[str, Any]] = None
+        
+        # Evita que dos hilos recalculen el mismo nodo a la vez
+        self._compute_lock = threading.RLock()
+        
+        # Se incrementa en cada mark_dirty: un recálculo que empezó antes de la
+        # última invalidación no deja el nodo como CLEAN
+        self._dirty_generation = 0
+        
+        # Cache compartido del grafo al que pertenece (lo asigna NodeGraph)
+        self._result_cache: Optional[ResultCache] = None
+        
         # Callbacks
         self.on_state_changed: Optional[Callable[['Node'], None]] = None
         self.on_value_changed: Optional[Callable[['Node'], None]] = None
@@ -181,9 +241,10 @@ class Node(ABC):
         """
         pass
     
-    def add_input(self, name: str, socket_type: 'SocketType', default_value: Any = None, is_multi: bool = False) -> Socket:
+    def add_input(self, name: str, socket_type: 'SocketType', default_value: Any = None,
+                  is_multi: bool = False, is_lazy: bool = False) -> Socket:
         """Añade un socket de entrada"""
-        socket = Socket(self, socket_type, SocketDirection.INPUT, name, default_value, is_multi)
+        socket = Socket(self, socket_type, SocketDirection.INPUT, name, default_value, is_multi, is_lazy)
         self.input_sockets[name] = socket
         return socket
     
@@ -199,6 +260,10 @@ class Node(ABC):
             raise KeyError(f"Input socket '{name}' not found in node {self.title}")
         return self.input_sockets[name].get_value()
     
+    def snapshot_inputs(self) -> tuple:
+        """Lee todos los inputs de una vez, en el orden en que fueron declarados"""
+        return tuple([socket.get_value() for socket in self.input_sockets.values()])
+    
     def get_output_value(self, name: str) -> Any:
         """Obtiene el valor de un output socket"""
         if name not in self.output_sockets:
@@ -209,23 +274,40 @@ class Node(ABC):
             return self._output_cache[name]
         
         # Recalcular si es necesario
-        if self.state == NodeState.DIRTY or not self._cache_valid:
-            self._recalculate()
+        self.evaluate()
             
         return self._output_cache.get(name)
     
+    def evaluate(self):
+        """Recalcula el nodo si su cache no es válido (seguro entre hilos)"""
+        if self.state == NodeState.DIRTY or not self._cache_valid:
+            with self._compute_lock:
+                if self.state == NodeState.DIRTY or not self._cache_valid:
+                    self._recalculate()
+    
     def _recalculate(self):
         """Recalcula los valores del nodo"""
         try:
+            generation = self._dirty_generation
             self._set_state(NodeState.PROCESSING)
             
             # Ejecutar lógica de computación
-            results = self.compute()
+            if self.MEMOIZE_COMPUTE:
+                results = self._compute_memoized()
+            elif self.CACHEABLE:
+                results = self._compute_shared()
+            else:
+                results = self.compute()
             
             # Actualizar cache
             self._output_cache = results
-            self._cache_valid = True
             
+            # Si el nodo se invalidó durante el cálculo (p. ej. un cambio de
+            # parámetro desde la GUI), el resultado ya no vale: sigue DIRTY
+            if generation != self._dirty_generation:
+                return
+            
+            self._cache_valid = True
             self._set_state(NodeState.CLEAN)
             
             # Notificar cambio de valor
@@ -237,19 +319,84 @@ class Node(ABC):
             # TODO: Sistema de logging de errores
             raise e
     
-    def mark_dirty(self, propagate: bool = True):
-        """Marca el nodo como dirty (necesita recálculo)"""
+    def _compute_memoized(self) -> Dict[str, Any]:
+        """Ejecuta compute() solo si cambiaron los inputs o el estado interno"""
+        key = (_freeze(self._memo_state()),) + tuple(
+            _freeze(value) for value in self.snapshot_inputs()
+        )
+        
+        if key == self._memo_key:
+            return self._memo_output
+        
+        results = self.compute()
+        self._memo_key = key
+        self._memo_output = results
+        return results
+    
+    def _compute_shared(self) -> Dict[str, Any]:
+        """Ejecuta compute() reutilizando el cache del grafo por firma de inputs"""
+        cache = self._result_cache
+        key = self._shared_key() if cache is not None else None
+        if key is None:
+            return self.compute()
+        
+        results = cache.get(key)
+        if results is None:
+            results = self.compute()
+            cache.put(key, results)
+        
+        # Copia propia: el dict cacheado se comparte entre nodos
+        return dict(results)
+    
+    def _shared_key(self) -> Optional[tuple]:
+        """
+        Firma del cálculo: tipo de nodo más, por cada input, su valor por defecto
+        o la versión (nodo, socket, generación) de cada salida conectada.
+        Retorna None si algún valor no puede usarse como clave.
+        """
+        key = [self.NODE_TYPE]
+        for socket in self.input_sockets.values():
+            if socket.connections:
+                key.append(tuple([
+                    (source.node.id, source.name, source.node._dirty_generation)
+                    for source in (connection.output_socket for connection in socket.connections)
+                ]))
+            else:
+                key.append(_freeze(socket.default_value))
+        
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _memo_state(self) -> Any:
+        """Estado interno que afecta a compute() además de los inputs"""
+        return None
+    
+    def mark_dirty(self, propagate: bool = True, outputs: Optional[Tuple[str, ...]] = None):
+        """
+        Marca el nodo como dirty (necesita recálculo).
+        Si se indican outputs, solo se invalidan los nodos conectados a esos sockets.
+        """
+        self._dirty_generation += 1
         if self.state != NodeState.DIRTY:
             self._set_state(NodeState.DIRTY)
             self._cache_valid = False
             
             # Propagar a nodos dependientes
             if propagate:
-                self._propagate_dirty()
+                self._propagate_dirty(outputs)
     
-    def _propagate_dirty(self):
-        """Propaga el estado dirty a nodos conectados"""
-        for output_socket in self.output_sockets.values():
+    def _propagate_dirty(self, outputs: Optional[Tuple[str, ...]] = None):
+        """Propaga el estado dirty a los nodos conectados a los outputs indicados (o a todos)"""
+        if outputs is None:
+            output_sockets = self.output_sockets.values()
+        else:
+            output_sockets = [self.output_sockets[name] for name in outputs]
+        
+        for output_socket in output_sockets:
             for connection in output_socket.connections:
                 connected_node = connection.input_socket.node
                 connected_node.mark_dirty(propagate=True)
@@ -345,22 +492,46 @@ class NodeGraph:
     Contenedor que mantiene una colección de nodos y sus conexiones
     """
     
+    # Capas con menos nodos se evalúan en el hilo que llama: compute() es
+    # Python puro (retiene el GIL) y repartir pocos nodos cuesta más que ahorra
+    PARALLEL_MIN_LAYER = 4
+    
     def __init__(self):
         self.nodes: Dict[str, Node] = {}
         self.connections: Dict[str, Connection] = {}
         
+        # Orden de ejecución cacheado; se recalcula solo si cambia la estructura
+        self._execution_order: Optional[List[Node]] = None
+        self._execution_order_version = -1
+        
+        # Resultados compartidos entre los nodos CACHEABLE de este grafo
+        self.result_cache = ResultCache()
+        
+        # Pool de hilos de execute_parallel, creado al primer uso y reutilizado
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers: Optional[int] = None
+        
     def add_node(self, node: Node) -> str:
         """Añade un nodo al grafo"""
-        self.nodes[node.id] = node
+        with Socket.topology_lock:
+            self.nodes[node.id] = node
+            node._result_cache = self.result_cache
+            self._execution_order = None
         return node.id
     
     def remove_node(self, node_id: str):
         """Remueve un nodo del grafo"""
-        if node_id in self.nodes:
-            node = self.nodes[node_id]
-            # Desconectar todas las conexiones
-            node.disconnect_all()
-            del self.nodes[node_id]
+        with Socket.topology_lock:
+            if node_id in self.nodes:
+                node = self.nodes[node_id]
+                # Desconectar todas las conexiones
+                node.disconnect_all()
+                del self.nodes[node_id]
+                node._result_cache = None
+                self._execution_order = None
+                
+                # Las firmas que citan al nodo quitado ya no volverán a pedirse
+                self.result_cache.clear()
     
     def connect_nodes(self, output_node_id: str, output_socket_name: str,
                      input_node_id: str, input_socket_name: str) -> Connection:
@@ -371,8 +542,9 @@ class NodeGraph:
         output_socket = output_node.output_sockets[output_socket_name]
         input_socket = input_node.input_sockets[input_socket_name]
         
-        connection = Connection(output_socket, input_socket)
-        self.connections[connection.id] = connection
+        with Socket.topology_lock:
+            connection = Connection(output_socket, input_socket)
+            self.connections[connection.id] = connection
         
         # Marcar el nodo de entrada como dirty
         input_node.mark_dirty()
@@ -381,18 +553,29 @@ class NodeGraph:
     
     def disconnect(self, connection_id: str):
         """Desconecta una conexión"""
-        if connection_id in self.connections:
-            connection = self.connections[connection_id]
+        with Socket.topology_lock:
+            connection = self.connections.pop(connection_id, None)
+            if connection is None:
+                return
             connection.disconnect()
-            del self.connections[connection_id]
-            
-            # Marcar el nodo de entrada como dirty
-            connection.input_socket.node.mark_dirty()
+        
+        # Marcar el nodo de entrada como dirty
+        connection.input_socket.node.mark_dirty()
     
     def get_execution_order(self) -> List[Node]:
         """
-        Obtiene el orden de ejecución de los nodos usando ordenamiento topológico
+        Obtiene el orden de ejecución de los nodos usando ordenamiento topológico.
+        El resultado se reutiliza mientras no cambien nodos ni conexiones.
         """
+        with Socket.topology_lock:
+            return self._execution_order_locked()
+    
+    def _execution_order_locked(self) -> List[Node]:
+        """get_execution_order con topology_lock ya tomado"""
+        if (self._execution_order is not None and
+                self._execution_order_version == Socket.topology_version):
+            return list(self._execution_order)
+        
         # Algoritmo de Kahn para ordenamiento topológico
         in_degree = {node_id: 0 for node_id in self.nodes}
         
@@ -403,11 +586,11 @@ class NodeGraph:
                     in_degree[node.id] += len(input_socket.connections)
         
         # Cola con nodos sin dependencias
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
         result = []
         
         while queue:
-            current_id = queue.pop(0)
+            current_id = queue.popleft()
             current_node = self.nodes[current_id]
             result.append(current_node)
             
@@ -422,14 +605,100 @@ class NodeGraph:
         # Verificar ciclos
         if len(result) != len(self.nodes):
             raise ValueError("Cycle detected in node graph")
+        
+        self._execution_order = result
+        self._execution_order_version = Socket.topology_version
+        return list(result)
+    
+    def get_execution_layers(self) -> List[List[Node]]:
+        """
+        Agrupa los nodos en capas: cada nodo solo depende de nodos de capas
+        anteriores, así que los de una misma capa pueden ejecutarse en paralelo
+        """
+        layer_of: Dict[str, int] = {}
+        layers: List[List[Node]] = []
+        
+        for node in self.get_execution_order():
+            layer = 0
+            for input_socket in node.input_sockets.values():
+                for connection in input_socket.connections:
+                    upstream_layer = layer_of.get(connection.output_socket.node.id)
+                    if upstream_layer is not None and upstream_layer >= layer:
+                        layer = upstream_layer + 1
             
-        return result
+            layer_of[node.id] = layer
+            if layer == len(layers):
+                layers.append([])
+            layers[layer].append(node)
+        
+        return layers
+    
+    def get_deferred_nodes(self) -> Set[str]:
+        """
+        IDs de los nodos que solo alimentan inputs lazy (directamente o a través
+        de otros nodos diferidos). No se ejecutan de antemano: el nodo que los
+        consume los calcula bajo demanda si llega a necesitarlos.
+        """
+        deferred: Set[str] = set()
+        
+        for node in reversed(self.get_execution_order()):
+            consumers = [connection.input_socket
+                         for output_socket in node.output_sockets.values()
+                         for connection in output_socket.connections]
+            
+            if consumers and all(socket.is_lazy or socket.node.id in deferred
+                                 for socket in consumers):
+                deferred.add(node.id)
+        
+        return deferred
+    
+    def execute_parallel(self, max_workers: Optional[int] = None) -> List[Node]:
+        """
+        Ejecuta el grafo capa por capa, repartiendo los nodos independientes
+        de cada capa entre un pool de hilos (ver PARALLEL_MIN_LAYER).
+        Retorna los nodos en orden de ejecución.
+        Los nodos diferidos (ver get_deferred_nodes) se omiten.
+        """
+        # Instantánea de la estructura: la GUI puede añadir o quitar nodos y
+        # conexiones mientras se ejecuta; esos cambios entran en la siguiente ejecución
+        with Socket.topology_lock:
+            deferred = self.get_deferred_nodes()
+            layers = self.get_execution_layers()
+        executed = []
+        
+        for layer in layers:
+            layer = [node for node in layer if node.id not in deferred]
+            if not layer:
+                continue
+            if len(layer) < self.PARALLEL_MIN_LAYER:
+                for node in layer:
+                    node.evaluate()
+            else:
+                # list() espera a toda la capa y propaga excepciones
+                list(self._get_executor(max_workers).map(Node.evaluate, layer))
+            executed.extend(layer)
+        
+        return executed
+    
+    def _get_executor(self, max_workers: Optional[int]) -> ThreadPoolExecutor:
+        """Pool de hilos del grafo; se recrea solo si cambia max_workers"""
+        if self._executor is None or self._executor_workers != max_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="goboflow-graph")
+            self._executor_workers = max_workers
+        return self._executor
     
     def clear(self):
         """Limpia el grafo de todos los nodos y conexiones"""
-        # Desconectar todo primero
-        for node in self.nodes.values():
-            node.disconnect_all()
-            
-        self.nodes.clear()
-        self.connections.clear()
\ No newline at end of file
+        with Socket.topology_lock:
+            # Desconectar todo primero
+            for node in self.nodes.values():
+                node.disconnect_all()
+                node._result_cache = None
+                
+            self.nodes.clear()
+            self.connections.clear()
+            self.result_cache.clear()
+            self._execution_order = None
\ No newline at end of file
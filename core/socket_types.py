@@ -161,6 +161,9 @@ class ColorType(SocketType):
             elif isinstance(value, dict):
                 # Verificar formato de diccionario
                 return 'r' in value and 'g' in value and 'b' in value
+            elif isinstance(value, int) and not isinstance(value, bool):
+                # Color empaquetado RGBA8888 (ver pack_rgba)
+                return 0 <= value <= 0xFFFFFFFF
             return False
         except (ValueError, TypeError):
             return False
@@ -192,6 +195,10 @@ class ColorType(SocketType):
                 color['a'] = float(value[3]) if len(value) > 3 else 1.0
                 return color
         
+        elif isinstance(value, int) and not isinstance(value, bool):
+            # Color empaquetado RGBA8888
+            return unpack_rgba(value)
+        
         elif isinstance(value, dict):
             # Ya está en formato de diccionario
             return {
@@ -375,6 +382,23 @@ def auto_convert_value(value: Any, target_type: SocketType) -> Any:
         else:
             return None
 
+def pack_rgba(color: dict) -> int:
+    """Empaqueta un color {'r','g','b','a'} (0-1) en un entero RGBA8888"""
+    packed = 0
+    for channel in ('r', 'g', 'b', 'a'):
+        level = int(round(min(max(color.get(channel, 1.0), 0.0), 1.0) * 255))
+        packed = (packed << 8) | level
+    return packed
+
+def unpack_rgba(packed: int) -> dict:
+    """Desempaqueta un entero RGBA8888 a un color {'r','g','b','a'} (0-1)"""
+    return {
+        'r': ((packed >> 24) & 0xFF) / 255.0,
+        'g': ((packed >> 16) & 0xFF) / 255.0,
+        'b': ((packed >> 8) & 0xFF) / 255.0,
+        'a': (packed & 0xFF) / 255.0
+    }
+
 def get_socket_color(socket_type: SocketType) -> str:
     """Obtiene el color para representar visualmente un tipo de socket"""
     return socket_type.color
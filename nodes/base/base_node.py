@@ -4,21 +4,32 @@ Implementaciones básicas de nodos comunes
 """
 
 from typing import Dict, Any, Optional, List
+import math
+import operator
+import random
 import uuid
 from abc import abstractmethod
 
 from core.node_system import Node
 from core.socket_types import (
     NUMBER, GEOMETRY, COLOR, STRING, BOOLEAN, VECTOR2D,
-    auto_convert_value
+    auto_convert_value, pack_rgba
 )
+from utils.geometry.base_geometry import Geometry, CompositeGeometry
+
+# Valores por defecto de sockets compartidos entre todas las instancias (inmutables)
+_ZERO_VEC2 = (0.0, 0.0)
+_ONE_VEC2 = (1.0, 1.0)
 
 class ParameterNode(Node):
     """
     Clase base para nodos de parámetros de entrada
     """
     
+    __slots__ = ("parameter_type", "parameter_value")
+    
     NODE_CATEGORY = "parameters"
+    MEMOIZE_COMPUTE = True
     
     def __init__(self, title: Optional[str] = None, parameter_type=NUMBER, default_value=None):
         # Establecer el tipo antes de llamar a super().__init__
@@ -41,11 +52,15 @@ class ParameterNode(Node):
         """Retorna el valor del parámetro"""
         return {"value": self.parameter_value}
     
+    def _memo_state(self):
+        """El valor del parámetro es el único estado del nodo"""
+        return self.parameter_value
+    
     def set_parameter(self, name: str, value: Any):
         """Establece el valor del parámetro"""
         if name == "value":
             self.parameter_value = auto_convert_value(value, self.parameter_type)
-            self.mark_dirty()
+            self.mark_dirty(outputs=("value",))
     
     def get_parameter_value(self):
         """Obtiene el valor actual del parámetro"""
@@ -56,6 +71,8 @@ class NumberParameterNode(ParameterNode):
     Nodo de parámetro numérico
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "number_parameter"
     NODE_TITLE = "Number"
     NODE_DESCRIPTION = "Parámetro numérico de entrada"
@@ -68,30 +85,94 @@ class VectorParameterNode(ParameterNode):
     Nodo de parámetro de vector 2D
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "vector_parameter"
     NODE_TITLE = "Vector"
     NODE_DESCRIPTION = "Parámetro de vector 2D"
     
+    # Índice de cada componente editable por separado
+    _COMPONENTS = {"x": 0, "y": 1}
+    
     def __init__(self, title: Optional[str] = None):
         super().__init__(title, VECTOR2D, [0.0, 0.0])
-
+    
+    def set_parameter(self, name: str, value: Any):
+        """Establece el vector completo ("value") o una componente ("x"/"y")"""
+        index = self._COMPONENTS.get(name)
+        if index is None:
+            super().set_parameter(name, value)
+            return
+        
+        component = auto_convert_value(value, NUMBER)
+        if self.parameter_value[index] == component:
+            return
+        
+        # Vector nuevo: el anterior puede seguir en uso como salida ya entregada
+        value = list(self.parameter_value)
+        value[index] = component
+        self.parameter_value = value
+        self.mark_dirty(outputs=("value",))
+    
 class ColorParameterNode(ParameterNode):
     """
     Nodo de parámetro de color
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "color_parameter"
     NODE_TITLE = "Color"
     NODE_DESCRIPTION = "Parámetro de color"
     
     def __init__(self, title: Optional[str] = None):
         super().__init__(title, COLOR, {'r': 1.0, 'g': 1.0, 'b': 1.0, 'a': 1.0})
-
+    
+    @property
+    def packed(self) -> int:
+        """Color actual empaquetado como entero RGBA8888"""
+        return pack_rgba(self.parameter_value)
+    
+class GeneratorNode(Node):
+    """
+    Clase base para nodos que generan geometría a partir de parámetros
+    """
+    
+    __slots__ = ("parameters",)
+    
+    NODE_CATEGORY = "generators"
+    
+    def __init__(self, title: Optional[str] = None):
+        # Parámetros internos (usados cuando no hay input conectado)
+        self.parameters: Dict[str, Any] = {}
+    
+        super().__init__(title)
+    
+    @abstractmethod
+    def generate_geometry(self) -> Any:
+        """Genera la geometría del nodo. Debe ser implementado por subclases."""
+        pass
+    
+    def compute(self) -> Dict[str, Any]:
+        """Retorna la geometría generada"""
+        return {"geometry": self.generate_geometry()}
+    
+    def set_parameter(self, name: str, value: Any):
+        """Establece un parámetro interno"""
+        self.parameters[name] = value
+        self.mark_dirty()
+    
+    def get_parameter(self, name: str, default: Any = None) -> Any:
+        """Obtiene un parámetro interno"""
+        return self.parameters.get(name, default)
+    
 class ViewerNode(Node):
     """
     Nodo visor para mostrar resultados
     """
     
+    __slots__ = ("_last_data", "_data_type")
+    
     NODE_TYPE = "viewer"
     NODE_TITLE = "Viewer"
     NODE_CATEGORY = "outputs"
@@ -112,9 +193,7 @@ class ViewerNode(Node):
     
     def compute(self) -> Dict[str, Any]:
         """Procesa los datos de entrada para visualización"""
-        geometry = self.get_input_value("geometry")
-        color = self.get_input_value("color")
-        opacity = self.get_input_value("opacity")
+        geometry, color, opacity = self.snapshot_inputs()
         
         # Almacenar datos para visualización
         self._last_data = geometry
@@ -144,6 +223,8 @@ class TransformNode(Node):
     Nodo base para transformaciones geométricas
     """
     
+    __slots__ = ()
+    
     NODE_CATEGORY = "modifiers"
     
     def __init__(self, title: Optional[str] = None):
@@ -152,23 +233,19 @@ class TransformNode(Node):
     def _init_sockets(self):
         """Inicializa sockets de transformación"""
         self.add_input("geometry", GEOMETRY, None)
-        self.add_input("translation", VECTOR2D, [0.0, 0.0])
+        self.add_input("translation", VECTOR2D, _ZERO_VEC2)
         self.add_input("rotation", NUMBER, 0.0)
-        self.add_input("scale", VECTOR2D, [1.0, 1.0])
+        self.add_input("scale", VECTOR2D, _ONE_VEC2)
         
         self.add_output("geometry", GEOMETRY)
     
     def compute(self) -> Dict[str, Any]:
         """Aplica transformaciones a la geometría"""
-        geometry = self.get_input_value("geometry")
+        geometry, translation, rotation, scale = self.snapshot_inputs()
         
         if geometry is None:
             return {"geometry": None}
         
-        translation = self.get_input_value("translation")
-        rotation = self.get_input_value("rotation")
-        scale = self.get_input_value("scale")
-        
         # Aplicar transformaciones
         transformed_geometry = self.apply_transform(geometry, translation, rotation, scale)
         
@@ -178,16 +255,35 @@ class TransformNode(Node):
     def apply_transform(self, geometry, translation, rotation, scale):
         """Aplica las transformaciones a la geometría. Debe ser implementado por subclases."""
         pass
+    
+    def apply_transform_batch(self, geometries: List[Any], params: List[tuple]) -> List[Any]:
+        """
+        Transforma muchas geometrías de una vez (instancing).
+        params contiene una tupla (translation, rotation, scale) por geometría,
+        con rotation en radianes. Las geometrías base usan Geometry.transform
+        (una matriz afín por geometría); el resto pasa por apply_transform.
+        """
+        apply_transform = self.apply_transform
+        return [geometry.transform(tuple(translation), rotation, tuple(scale))
+                if isinstance(geometry, Geometry)
+                else apply_transform(geometry, translation, rotation, scale)
+                for geometry, (translation, rotation, scale) in zip(geometries, params)]
 
 class MergeNode(Node):
     """
     Nodo para combinar múltiples geometrías
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "merge"
     NODE_TITLE = "Merge"
     NODE_CATEGORY = "operations"
     NODE_DESCRIPTION = "Combina múltiples geometrías"
+    CACHEABLE = True
+    
+    # Nombres de los inputs de geometría, en orden
+    _GEOMETRY_INPUTS = ("geometry1", "geometry2", "geometry3")
     
     def __init__(self, title: Optional[str] = None):
         super().__init__(title)
@@ -206,8 +302,8 @@ class MergeNode(Node):
         geometries = []
         
         # Recopilar todas las geometrías no nulas
-        for i in range(1, 4):
-            geom = self.get_input_value(f"geometry{i}")
+        for name in self._GEOMETRY_INPUTS:
+            geom = self.get_input_value(name)
             if geom is not None:
                 geometries.append(geom)
         
@@ -227,8 +323,11 @@ class MergeNode(Node):
         if len(geometries) == 1:
             return geometries[0]
         
-        # Para ahora, retornar la primera geometría
-        # TODO: Implementar merge real según el tipo de geometría
+        # Las geometrías base se combinan en un solo compuesto (n-ario)
+        if all(isinstance(geometry, Geometry) for geometry in geometries):
+            return CompositeGeometry.merge_many(geometries)
+        
+        # TODO: Implementar merge para otros tipos de geometría
         return geometries[0]
 
 class SplitNode(Node):
@@ -236,10 +335,17 @@ class SplitNode(Node):
     Nodo para separar componentes de una geometría
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "split"
     NODE_TITLE = "Split"
     NODE_CATEGORY = "operations"
     NODE_DESCRIPTION = "Separa componentes de una geometría"
+    CACHEABLE = True
+    
+    # Nombres de los outputs de componentes y resultado vacío
+    _COMPONENT_OUTPUTS = ("output1", "output2", "output3")
+    _EMPTY_RESULT = {"output1": None, "output2": None, "output3": None, "count": 0}
     
     def __init__(self, title: Optional[str] = None):
         super().__init__(title)
@@ -257,27 +363,17 @@ class SplitNode(Node):
     
     def compute(self) -> Dict[str, Any]:
         """Separa la geometría de entrada"""
-        geometry = self.get_input_value("geometry")
-        method = self.get_input_value("method")
+        geometry, method = self.snapshot_inputs()
         
         if geometry is None:
-            return {
-                "output1": None,
-                "output2": None,
-                "output3": None,
-                "count": 0
-            }
+            return dict(self._EMPTY_RESULT)
         
         # Separar según el método
         components = self.split_geometry(geometry, method)
         
-        # Asignar a outputs
-        result = {}
-        for i in range(1, 4):
-            if i <= len(components):
-                result[f"output{i}"] = components[i-1]
-            else:
-                result[f"output{i}"] = None
+        # Asignar a outputs (los que sobran quedan en None)
+        result = dict(self._EMPTY_RESULT)
+        result.update(zip(self._COMPONENT_OUTPUTS, components))
         
         result["count"] = len(components)
         
@@ -291,11 +387,54 @@ class SplitNode(Node):
         # Por ahora, retornar la geometría original como único componente
         return [geometry] if geometry else []
 
+def _info_area(geometry, info):
+    info["area"] = float(geometry.area)
+
+def _info_perimeter(geometry, info):
+    info["perimeter"] = float(geometry.perimeter)
+
+def _info_center(geometry, info):
+    center = geometry.center
+    if isinstance(center, (list, tuple)):
+        info["center"] = [float(center[0]), float(center[1])]
+
+def _info_bounds(geometry, info):
+    bbox = geometry.bbox
+    if bbox and len(bbox) >= 4:
+        info["bounds"] = [float(bbox[2] - bbox[0]), float(bbox[3] - bbox[1])]
+
+def _info_vertex_count(geometry, info):
+    info["vertex_count"] = len(geometry.vertices)
+
+# Atributo de la geometría -> función que vuelca la métrica en el dict de InfoNode
+_INFO_METRICS = (
+    ("area", _info_area),
+    ("perimeter", _info_perimeter),
+    ("center", _info_center),
+    ("bbox", _info_bounds),
+    ("vertices", _info_vertex_count),
+)
+
+def _info_empty() -> Dict[str, Any]:
+    """Valores de InfoNode cuando no hay geometría o falta una métrica"""
+    return {
+        "area": 0.0,
+        "perimeter": 0.0,
+        "center": [0.0, 0.0],
+        "bounds": [0.0, 0.0],
+        "vertex_count": 0
+    }
+
+# Tipo de geometría -> métricas que expone, calculado la primera vez que se ve
+_INFO_PROBES: Dict[type, tuple] = {}
+
 class InfoNode(Node):
     """
     Nodo para obtener información sobre geometrías
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "info"
     NODE_TITLE = "Info"
     NODE_CATEGORY = "utilities"
@@ -320,53 +459,27 @@ class InfoNode(Node):
         geometry = self.get_input_value("geometry")
         
         if geometry is None:
-            return {
-                "area": 0.0,
-                "perimeter": 0.0,
-                "center": [0.0, 0.0],
-                "bounds": [0.0, 0.0],
-                "vertex_count": 0
-            }
+            return _info_empty()
         
         # Calcular información
-        info = self.calculate_geometry_info(geometry)
-        
-        return info
+        return self.calculate_geometry_info(geometry)
     
     def calculate_geometry_info(self, geometry: Any) -> Dict[str, Any]:
         """
         Calcula información detallada sobre una geometría.
         Implementación básica - debe ser extendida según el tipo de geometría.
         """
-        info = {
-            "area": 0.0,
-            "perimeter": 0.0,
-            "center": [0.0, 0.0],
-            "bounds": [0.0, 0.0],
-            "vertex_count": 0
-        }
+        info = _info_empty()
         
-        # Si la geometría tiene métodos específicos, usarlos
-        if hasattr(geometry, 'area'):
-            info["area"] = float(geometry.area)
+        # Métricas disponibles para este tipo de geometría (se sondean una vez por tipo)
+        geometry_type = type(geometry)
+        probes = _INFO_PROBES.get(geometry_type)
+        if probes is None:
+            probes = tuple(fill for name, fill in _INFO_METRICS if hasattr(geometry, name))
+            _INFO_PROBES[geometry_type] = probes
         
-        if hasattr(geometry, 'perimeter'):
-            info["perimeter"] = float(geometry.perimeter)
-        
-        if hasattr(geometry, 'center'):
-            center = geometry.center
-            if isinstance(center, (list, tuple)):
-                info["center"] = [float(center[0]), float(center[1])]
-        
-        if hasattr(geometry, 'bbox'):
-            bbox = geometry.bbox
-            if bbox and len(bbox) >= 4:
-                width = bbox[2] - bbox[0]
-                height = bbox[3] - bbox[1]
-                info["bounds"] = [float(width), float(height)]
-        
-        if hasattr(geometry, 'vertices'):
-            info["vertex_count"] = len(geometry.vertices)
+        for fill in probes:
+            fill(geometry, info)
         
         return info
 
@@ -375,30 +488,32 @@ class ConditionalNode(Node):
     Nodo condicional que selecciona entre dos entradas
     """
     
+    __slots__ = ()
+    
     NODE_TYPE = "conditional"
     NODE_TITLE = "Switch"
     NODE_CATEGORY = "logic"
     NODE_DESCRIPTION = "Selecciona entre dos entradas basado en una condición"
     
+    # Input a leer indexado por bool(condición)
+    _BRANCH_INPUTS = ("false_input", "true_input")
+    
     def __init__(self, title: Optional[str] = None):
         super().__init__(title)
     
     def _init_sockets(self):
         """Inicializa sockets para condicional"""
         self.add_input("condition", BOOLEAN, False)
-        self.add_input("true_input", GEOMETRY, None)
-        self.add_input("false_input", GEOMETRY, None)
+        # Ramas lazy: solo se evalúa la rama seleccionada
+        self.add_input("true_input", GEOMETRY, None, is_lazy=True)
+        self.add_input("false_input", GEOMETRY, None, is_lazy=True)
         
         self.add_output("output", GEOMETRY)
     
     def compute(self) -> Dict[str, Any]:
         """Selecciona la entrada según la condición"""
         condition = self.get_input_value("condition")
-        
-        if condition:
-            selected = self.get_input_value("true_input")
-        else:
-            selected = self.get_input_value("false_input")
+        selected = self.get_input_value(self._BRANCH_INPUTS[bool(condition)])
         
         return {"output": selected}
 
@@ -407,14 +522,18 @@ class RandomNode(Node):
     Nodo generador de números aleatorios
     """
     
+    __slots__ = ("_rng",)
+    
     NODE_TYPE = "random"
     NODE_TITLE = "Random"
     NODE_CATEGORY = "generators"
     NODE_DESCRIPTION = "Genera números aleatorios"
+    MEMOIZE_COMPUTE = True
     
     def __init__(self, title: Optional[str] = None):
         super().__init__(title)
-        self._last_seed = None
+        # Generador propio: no altera ni depende del estado global de random
+        self._rng = random.Random()
     
     def _init_sockets(self):
         """Inicializa sockets para random"""
@@ -427,22 +546,19 @@ class RandomNode(Node):
     
     def compute(self) -> Dict[str, Any]:
         """Genera valores aleatorios"""
-        import random
-        
-        seed = int(self.get_input_value("seed"))
-        min_val = self.get_input_value("min_value")
-        max_val = self.get_input_value("max_value")
+        seed, min_val, max_val = self.snapshot_inputs()
+        seed = int(seed)
         
-        # Usar seed para resultados reproducibles
-        if seed != self._last_seed:
-            random.seed(seed)
-            self._last_seed = seed
+        # Re-sembrar en cada cálculo: mismos inputs, mismos resultados
+        rng = self._rng
+        rng.seed(seed)
+        uniform = rng.uniform
         
         # Generar valores
-        random_value = random.uniform(min_val, max_val)
+        random_value = uniform(min_val, max_val)
         random_vector = [
-            random.uniform(min_val, max_val),
-            random.uniform(min_val, max_val)
+            uniform(min_val, max_val),
+            uniform(min_val, max_val)
         ]
         
         return {
@@ -450,15 +566,40 @@ class RandomNode(Node):
             "vector": random_vector
         }
 
+# Operaciones de MathNode, resueltas con una sola búsqueda en diccionario
+_BINARY_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": lambda a, b: a / b if b != 0 else 0.0,
+    "power": pow,
+    "modulo": lambda a, b: a % b if b != 0 else 0.0,
+    "min": min,
+    "max": max,
+}
+
+_UNARY_OPS = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "sqrt": lambda a: math.sqrt(abs(a)),
+    "abs": abs,
+    "floor": math.floor,
+    "ceil": math.ceil,
+}
+
 class MathNode(Node):
     """
     Nodo para operaciones matemáticas básicas
     """
     
+    __slots__ = ("operation",)
+    
     NODE_TYPE = "math"
     NODE_TITLE = "Math"
     NODE_CATEGORY = "math"
     NODE_DESCRIPTION = "Operaciones matemáticas básicas"
+    MEMOIZE_COMPUTE = True
     
     def __init__(self, title: Optional[str] = None):
         super().__init__(title)
@@ -474,47 +615,20 @@ class MathNode(Node):
     
     def compute(self) -> Dict[str, Any]:
         """Realiza operación matemática"""
-        import math
-        
-        a = self.get_input_value("a")
-        b = self.get_input_value("b")
-        operation = self.get_input_value("operation").lower()
-        
-        result = 0.0
+        # Los sockets ya son NUMBER/STRING: solo cubrir entradas vacías (None)
+        a, b, operation = self.snapshot_inputs()
+        a = a or 0.0
+        b = b or 0.0
+        operation = (operation or "add").lower()
         
         try:
-            if operation == "add":
-                result = a + b
-            elif operation == "subtract":
-                result = a - b
-            elif operation == "multiply":
-                result = a * b
-            elif operation == "divide":
-                result = a / b if b != 0 else 0.0
-            elif operation == "power":
-                result = pow(a, b)
-            elif operation == "modulo":
-                result = a % b if b != 0 else 0.0
-            elif operation == "min":
-                result = min(a, b)
-            elif operation == "max":
-                result = max(a, b)
-            elif operation == "sin":
-                result = math.sin(a)
-            elif operation == "cos":
-                result = math.cos(a)
-            elif operation == "tan":
-                result = math.tan(a)
-            elif operation == "sqrt":
-                result = math.sqrt(abs(a))
-            elif operation == "abs":
-                result = abs(a)
-            elif operation == "floor":
-                result = math.floor(a)
-            elif operation == "ceil":
-                result = math.ceil(a)
+            binary_op = _BINARY_OPS.get(operation)
+            if binary_op is not None:
+                result = binary_op(a, b)
             else:
-                result = a  # Operación no reconocida, devolver primer valor
+                unary_op = _UNARY_OPS.get(operation)
+                # Operación no reconocida, devolver primer valor
+                result = unary_op(a) if unary_op is not None else a
                 
         except (ValueError, ZeroDivisionError, OverflowError):
             result = 0.0
@@ -532,90 +646,45 @@ class MathNode(Node):
 
 def create_parameter_node(param_type: str, value: Any = None, title: str = None):
     """Factory function para crear nodos de parámetros"""
-    if param_type.lower() == "number":
-        node = NumberParameterNode(title)
-        if value is not None:
-            node.set_parameter("value", value)
-        return node
-    elif param_type.lower() == "vector":
-        node = VectorParameterNode(title)
-        if value is not None:
-            node.set_parameter("value", value)
-        return node
-    elif param_type.lower() == "color":
-        node = ColorParameterNode(title)
-        if value is not None:
-            node.set_parameter("value", value)
-        return node
-    else:
+    node_class = _PARAM_FACTORIES.get(param_type.lower())
+    if node_class is None:
         raise ValueError(f"Tipo de parámetro no soportado: {param_type}")
+    
+    node = node_class(title)
+    if value is not None:
+        node.set_parameter("value", value)
+    return node
 
 def get_base_node_types():
     """Retorna lista de todos los tipos de nodos base disponibles"""
-    return [
-        NumberParameterNode,
-        VectorParameterNode,
-        ColorParameterNode,
-        ViewerNode,
-        MergeNode,
-        SplitNode,
-        InfoNode,
-        ConditionalNode,
-        RandomNode,
-        MathNode
-    ]
+    return list(_BASE_NODE_TYPES)
 
 def create_node_by_type(node_type: str, title: str = None):
     """Factory function para crear nodos por tipo"""
-    node_map = {
-        "number_parameter": NumberParameterNode,
-        "vector_parameter": VectorParameterNode,
-        "color_parameter": ColorParameterNode,
-        "viewer": ViewerNode,
-        "merge": MergeNode,
-        "split": SplitNode,
-        "info": InfoNode,
-        "conditional": ConditionalNode,
-        "random": RandomNode,
-        "math": MathNode
-    }
-    
-    if node_type in node_map:
-        return node_map[node_type](title)
-    else:
+    node_class = _NODE_FACTORIES.get(node_type.lower())
+    if node_class is None:
         raise ValueError(f"Tipo de nodo no encontrado: {node_type}")
+    
+    return node_class(title)
 
-# ===========================================
-# PRUEBAS DE NODOS BASE
-# ===========================================
+# Tablas de las factories, construidas una sola vez al importar el módulo
+_PARAM_FACTORIES = {
+    "number": NumberParameterNode,
+    "vector": VectorParameterNode,
+    "color": ColorParameterNode,
+}
 
-def test_base_nodes():
-    """Pruebas básicas de los nodos base"""
-    print("🧪 Probando nodos base...")
-    
-    # Probar NumberParameterNode
-    num_node = NumberParameterNode("Test Number")
-    num_node.set_parameter("value", 42.5)
-    result = num_node.compute()
-    assert result["value"] == 42.5
-    print("✅ NumberParameterNode OK")
-    
-    # Probar ViewerNode
-    viewer = ViewerNode("Test Viewer")
-    viewer_result = viewer.compute()
-    assert "display_geometry" in viewer_result
-    print("✅ ViewerNode OK")
-    
-    # Probar MathNode
-    math_node = MathNode("Test Math")
-    # Simular entrada
-    math_node.add_input("a", NUMBER, 5.0)
-    math_node.add_input("b", NUMBER, 3.0)
-    math_result = math_node.compute()
-    assert math_result["result"] == 8.0  # 5 + 3
-    print("✅ MathNode OK")
-    
-    print("🎉 Todos los tests de nodos base pasaron!")
+_BASE_NODE_TYPES = (
+    NumberParameterNode,
+    VectorParameterNode,
+    ColorParameterNode,
+    ViewerNode,
+    MergeNode,
+    SplitNode,
+    InfoNode,
+    ConditionalNode,
+    RandomNode,
+    MathNode
+)
 
-if __name__ == "__main__":
-    test_base_nodes()
\ No newline at end of file
+_NODE_FACTORIES = {node_class.NODE_TYPE: node_class for node_class in _BASE_NODE_TYPES}
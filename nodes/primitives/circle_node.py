@@ -4,11 +4,51 @@ Genera geometrías circulares procedurales
 """
 
 import math
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Iterable, List, Sequence
 
 from core.node_system import Node
 from core.socket_types import NUMBER, GEOMETRY, VECTOR2D, POSITIVE_NUMBER
-from utils.geometry.base_geometry import Circle
+from utils.geometry.base_geometry import Circle, Polygon, unit_circle_points
+
+# Estilo SVG por defecto de los círculos, y su forma ya serializada
+_DEFAULT_SVG_STYLE = {
+    "fill": "white",
+    "opacity": "0.8",
+    "stroke": "none"
+}
+_DEFAULT_SVG_STYLE_STR = "; ".join(f"{k}: {v}" for k, v in _DEFAULT_SVG_STYLE.items())
+_SVG_CIRCLE_TPL = '<circle cx="{}" cy="{}" r="{}" style="{}"/>'
+
+# Límites de los parámetros del círculo
+_MIN_RADIUS = 0.1
+_MIN_SEGMENTS = 3
+_MAX_SEGMENTS = 256
+
+def _clamp(value, low, high):
+    """Limita value a [low, high] con comparaciones directas (sin max/min)"""
+    return low if value < low else (high if value > high else value)
+
+def _make_circle(center: Tuple[float, float], radius: float, segments: int) -> Circle:
+    """
+    Círculo nuevo en cada llamada: Circle es mutable (set_radius, etc.), así
+    que no se comparte entre nodos. Lo que sí se comparte es la plantilla
+    unitaria, de modo que la trigonometría se calcula una vez por segmentos.
+    """
+    return Circle(center, radius, segments, unit_circle_points(segments))
+
+@lru_cache(maxsize=128)
+def _ellipse_points(center: Tuple[float, float], radius_x: float, radius_y: float,
+                    segments: int) -> Tuple[Tuple[float, float], ...]:
+    """Vértices de la elipse (tupla inmutable), escalando por eje el círculo unitario"""
+    cx, cy = center
+    return tuple([(cx + radius_x * ux, cy + radius_y * uy)
+                  for ux, uy in unit_circle_points(segments)])
+
+def _make_ellipse(center: Tuple[float, float], radius_x: float, radius_y: float,
+                  segments: int) -> Polygon:
+    """Elipse como polígono nuevo; los vértices se calculan una vez por parámetros"""
+    return Polygon(list(_ellipse_points(center, radius_x, radius_y, segments)))
 
 class CircleNode(Node):
     """
@@ -25,12 +65,13 @@ class CircleNode(Node):
         
         # Parámetros internos
         self._last_geometry = None
-        self._last_params = {}
+        self._last_key = None
+        self._center_out = None  # Lista "center_out" reutilizada mientras el centro no cambie
     
     def _init_sockets(self):
         """Inicializa los sockets del nodo círculo"""
         # Inputs
-        self.add_input("center", VECTOR2D, [0.0, 0.0])
+        self.add_input("center", VECTOR2D, (0.0, 0.0))
         self.add_input("radius", POSITIVE_NUMBER, 100.0)
         self.add_input("segments", NUMBER, 32)
         
@@ -42,32 +83,26 @@ class CircleNode(Node):
     
     def compute(self) -> Dict[str, Any]:
         """Genera la geometría del círculo"""
-        # Obtener parámetros de entrada
-        center = self.get_input_value("center")
-        radius = self.get_input_value("radius")
-        segments = int(self.get_input_value("segments"))
+        # Obtener parámetros de entrada (una sola pasada por los sockets)
+        center, radius, segments = self.snapshot_inputs()
+        segments = int(segments)
         
         # Validar parámetros
-        radius = max(0.1, radius)  # Radio mínimo
-        segments = max(3, min(256, segments))  # Límites de segmentos
+        if radius < _MIN_RADIUS:
+            radius = _MIN_RADIUS  # Radio mínimo
+        segments = _clamp(segments, _MIN_SEGMENTS, _MAX_SEGMENTS)  # Límites de segmentos
         
-        # Convertir center a tupla si es lista
-        if isinstance(center, list):
-            center = (center[0], center[1])
+        # Convertir center a tupla (sin copia si ya lo es)
+        center = tuple(center)
         
         # Verificar si necesitamos regenerar la geometría
-        current_params = {
-            'center': center,
-            'radius': radius,
-            'segments': segments
-        }
-        
-        if (self._last_geometry is None or 
-            current_params != self._last_params):
-            
-            # Generar nueva geometría
-            self._last_geometry = Circle(center, radius, segments)
-            self._last_params = current_params
+        key = (center, radius, segments)
+        if key != self._last_key:
+            # Generar nueva geometría (propia de este nodo)
+            self._last_geometry = _make_circle(center, radius, segments)
+            if self._last_key is None or center != self._last_key[0]:
+                self._center_out = list(center)
+            self._last_key = key
         
         # Calcular propiedades
         area = self._last_geometry.area
@@ -77,7 +112,7 @@ class CircleNode(Node):
             "geometry": self._last_geometry,
             "area": area,
             "perimeter": perimeter,
-            "center_out": list(center)
+            "center_out": self._center_out
         }
     
     def generate_geometry(self) -> Optional[Circle]:
@@ -86,8 +121,8 @@ class CircleNode(Node):
         Usado por el sistema de preview y exportación
         """
         try:
-            result = self.compute()
-            return result.get("geometry")
+            # Usa el cache del nodo: solo recalcula si está dirty
+            return self.get_output_value("geometry")
         except Exception as e:
             print(f"Error generando geometría en {self.title}: {e}")
             return None
@@ -95,8 +130,7 @@ class CircleNode(Node):
     def get_preview_info(self) -> Dict[str, Any]:
         """Obtiene información para preview del nodo"""
         try:
-            result = self.compute()
-            geometry = result.get("geometry")
+            geometry = self.get_output_value("geometry")
             
             if geometry:
                 return {
@@ -119,21 +153,21 @@ class CircleNode(Node):
         if "radius" in self.input_sockets:
             # Si hay conexión, no cambiar el valor por defecto
             if not self.input_sockets["radius"].connections:
-                self.input_sockets["radius"].default_value = max(0.1, radius)
+                self.input_sockets["radius"].default_value = max(_MIN_RADIUS, radius)
                 self.mark_dirty()
     
     def set_center(self, center: tuple):
         """Establece el centro del círculo"""
         if "center" in self.input_sockets:
             if not self.input_sockets["center"].connections:
-                self.input_sockets["center"].default_value = list(center)
+                self.input_sockets["center"].default_value = (float(center[0]), float(center[1]))
                 self.mark_dirty()
     
     def set_segments(self, segments: int):
         """Establece el número de segmentos"""
         if "segments" in self.input_sockets:
             if not self.input_sockets["segments"].connections:
-                segments = max(3, min(256, segments))
+                segments = _clamp(segments, _MIN_SEGMENTS, _MAX_SEGMENTS)
                 self.input_sockets["segments"].default_value = segments
                 self.mark_dirty()
     
@@ -149,24 +183,27 @@ class CircleNode(Node):
         if not geometry:
             return ""
         
-        # Estilo por defecto
-        style = {
-            "fill": "white",
-            "opacity": "0.8",
-            "stroke": "none"
-        }
-        
-        # Aplicar overrides
-        if style_override:
-            style.update(style_override)
-        
-        # Construir string de estilo
-        style_str = "; ".join([f"{k}: {v}" for k, v in style.items()])
-        
         cx, cy = geometry.circle_center
-        r = geometry.radius
         
-        return f'<circle cx="{cx}" cy="{cy}" r="{r}" style="{style_str}"/>'
+        return _SVG_CIRCLE_TPL.format(cx, cy, geometry.radius, _svg_style_str(style_override))
+    
+    def _resolved_params(self) -> Tuple[Tuple[float, float], float, int]:
+        """
+        (center, radius, segments) ya validados, tal como los resolvió el
+        último compute(), sin volver a leer los inputs
+        """
+        self.evaluate()
+        if self._last_key is not None:
+            return self._last_key
+        
+        # Subclases con su propio compute(): leer los inputs directamente,
+        # validándolos una vez para todo el lote
+        center = self.get_input_value("center")
+        if isinstance(center, list):
+            center = (center[0], center[1])
+        radius = max(_MIN_RADIUS, self.get_input_value("radius"))
+        segments = _clamp(int(self.get_input_value("segments")), _MIN_SEGMENTS, _MAX_SEGMENTS)
+        return center, radius, segments
     
     def animate_radius(self, start_radius: float, end_radius: float, 
                       frame: int, total_frames: int) -> float:
@@ -197,22 +234,11 @@ class CircleNode(Node):
         Returns:
             Lista de geometrías Circle
         """
-        center = self.get_input_value("center")
-        base_radius = self.get_input_value("radius")
-        segments = int(self.get_input_value("segments"))
+        center, base_radius, segments = self._resolved_params()
         
-        if isinstance(center, list):
-            center = (center[0], center[1])
-        
-        circles = []
+        radii = [base_radius + i * spacing for i in range(count)]
         
-        for i in range(count):
-            radius = base_radius + (i * spacing)
-            if radius > 0:
-                circle = Circle(center, radius, segments)
-                circles.append(circle)
-        
-        return circles
+        return [_make_circle(center, radius, segments) for radius in radii if radius > 0]
     
     def create_circle_grid(self, rows: int, cols: int, 
                           spacing_x: float, spacing_y: float) -> list:
@@ -228,14 +254,7 @@ class CircleNode(Node):
         Returns:
             Lista de geometrías Circle
         """
-        base_center = self.get_input_value("center")
-        radius = self.get_input_value("radius")
-        segments = int(self.get_input_value("segments"))
-        
-        if isinstance(base_center, list):
-            base_center = (base_center[0], base_center[1])
-        
-        circles = []
+        base_center, radius, segments = self._resolved_params()
         
         # Calcular offset para centrar la grilla
         total_width = (cols - 1) * spacing_x
@@ -243,15 +262,14 @@ class CircleNode(Node):
         start_x = base_center[0] - total_width / 2
         start_y = base_center[1] - total_height / 2
         
-        for row in range(rows):
-            for col in range(cols):
-                x = start_x + col * spacing_x
-                y = start_y + row * spacing_y
-                
-                circle = Circle((x, y), radius, segments)
-                circles.append(circle)
+        # Coordenadas de columnas y filas, calculadas una sola vez
+        xs = [start_x + col * spacing_x for col in range(cols)]
+        ys = [start_y + row * spacing_y for row in range(rows)]
         
-        return circles
+        # Plantilla unitaria compartida: la trigonometría se calcula una vez
+        unit = unit_circle_points(segments)
+        
+        return [Circle((x, y), radius, segments, unit) for y in ys for x in xs]
     
     def create_spiral_circles(self, count: int, turns: float, 
                              radius_growth: float) -> list:
@@ -266,28 +284,28 @@ class CircleNode(Node):
         Returns:
             Lista de geometrías Circle
         """
-        base_center = self.get_input_value("center")
-        circle_radius = self.get_input_value("radius")
-        segments = int(self.get_input_value("segments"))
-        
-        if isinstance(base_center, list):
-            base_center = (base_center[0], base_center[1])
+        base_center, circle_radius, segments = self._resolved_params()
         
+        # Plantilla unitaria compartida: la trigonometría se calcula una vez
+        unit = unit_circle_points(segments)
+        cx, cy = base_center
         circles = []
         
+        # El ángulo avanza un paso fijo por círculo: en vez de cos/sin por
+        # iteración se rota un número complejo unitario (z *= w). El error
+        # acumulado es O(count * ε), despreciable para cualquier count razonable
+        step = 2 * math.pi * turns / count if count else 0.0
+        w = complex(math.cos(step), math.sin(step))
+        z = 1 + 0j
+        
         for i in range(count):
-            # Calcular ángulo y radio de la espiral
-            t = i / count  # Parámetro normalizado (0-1)
-            angle = 2 * math.pi * turns * t
-            spiral_radius = radius_growth * t
+            # Radio de la espiral (parámetro normalizado t = i / count)
+            spiral_radius = radius_growth * i / count
             
             # Posición en la espiral
-            x = base_center[0] + spiral_radius * math.cos(angle)
-            y = base_center[1] + spiral_radius * math.sin(angle)
-            
-            # Crear círculo
-            circle = Circle((x, y), circle_radius, segments)
-            circles.append(circle)
+            center = (cx + spiral_radius * z.real, cy + spiral_radius * z.imag)
+            circles.append(Circle(center, circle_radius, segments, unit))
+            z *= w
         
         return circles
     
@@ -312,12 +330,52 @@ class CircleNode(Node):
         # Restaurar parámetros específicos
         if 'circle_params' in data:
             params = data['circle_params']
-            node.set_center(tuple(params.get('center', [0, 0])))
+            node.set_center(params.get('center', (0, 0)))
             node.set_radius(params.get('radius', 100))
             node.set_segments(params.get('segments', 32))
         
         return node
 
+def _svg_style_str(style_override: Optional[Dict[str, str]] = None) -> str:
+    """String de estilo SVG; sin overrides se reutiliza el precalculado"""
+    if not style_override:
+        return _DEFAULT_SVG_STYLE_STR
+    
+    style = dict(_DEFAULT_SVG_STYLE)
+    style.update(style_override)
+    return "; ".join(f"{k}: {v}" for k, v in style.items())
+
+def circles_to_svg(circles: Iterable[Circle], 
+                   style_override: Optional[Dict[str, str]] = None) -> str:
+    """Exporta muchos círculos como elementos SVG en una sola pasada"""
+    style_str = _svg_style_str(style_override)
+    tpl = _SVG_CIRCLE_TPL
+    return "".join([tpl.format(c.circle_center[0], c.circle_center[1], c.radius, style_str)
+                    for c in circles])
+
+def circle_intersects_circle(circle1: Circle, circle2: Circle) -> bool:
+    """Verifica si dos círculos se intersectan (comparando distancias al cuadrado)"""
+    dx = circle1.circle_center[0] - circle2.circle_center[0]
+    dy = circle1.circle_center[1] - circle2.circle_center[1]
+    radius_sum = circle1.radius + circle2.radius
+    return dx * dx + dy * dy <= radius_sum * radius_sum
+
+def circle_collision_pairs(circles: Sequence[Circle]) -> List[Tuple[int, int]]:
+    """Índices (i, j) con i < j de todos los pares de círculos que se intersectan"""
+    data = [(c.circle_center[0], c.circle_center[1], c.radius) for c in circles]
+    pairs = []
+    
+    for i, (x1, y1, r1) in enumerate(data):
+        for j in range(i + 1, len(data)):
+            x2, y2, r2 = data[j]
+            dx = x1 - x2
+            dy = y1 - y2
+            radius_sum = r1 + r2
+            if dx * dx + dy * dy <= radius_sum * radius_sum:
+                pairs.append((i, j))
+    
+    return pairs
+
 # ===========================================
 # VARIACIONES DE CÍRCULO
 # ===========================================
@@ -347,21 +405,24 @@ class RingNode(CircleNode):
         segments = int(self.get_input_value("segments"))
         
         # Validar que el radio interno sea menor que el externo
-        inner_radius = min(inner_radius, outer_radius * 0.95)
+        max_inner = outer_radius * 0.95
+        if inner_radius > max_inner:
+            inner_radius = max_inner
         
         if isinstance(center, list):
             center = (center[0], center[1])
         
-        # Crear círculo externo e interno
-        outer_circle = Circle(center, outer_radius, segments)
-        inner_circle = Circle(center, inner_radius, segments)
+        # Crear círculo externo; el interno comparte centro y plantilla unitaria,
+        # así que no se construye hasta que exista una geometría de anillo real
+        outer_circle = _make_circle(center, outer_radius, segments)
         
         # Para un anillo, necesitaríamos una geometría más compleja
         # Por simplicidad, retornamos el círculo externo
         # TODO: Implementar geometría de anillo real
         
-        area = math.pi * (outer_radius ** 2 - inner_radius ** 2)
-        perimeter = 2 * math.pi * (outer_radius + inner_radius)
+        radius_sum = outer_radius + inner_radius
+        area = math.pi * (outer_radius - inner_radius) * radius_sum
+        perimeter = 2 * math.pi * radius_sum
         
         return {
             "geometry": outer_circle,  # Temporal
@@ -384,7 +445,7 @@ class EllipseNode(CircleNode):
     def _init_sockets(self):
         """Inicializa sockets específicos de la elipse"""
         # Modificar sockets del círculo
-        self.add_input("center", VECTOR2D, [0.0, 0.0])
+        self.add_input("center", VECTOR2D, (0.0, 0.0))
         self.add_input("radius_x", POSITIVE_NUMBER, 100.0)
         self.add_input("radius_y", POSITIVE_NUMBER, 50.0)
         self.add_input("segments", NUMBER, 32)
@@ -396,31 +457,22 @@ class EllipseNode(CircleNode):
     
     def compute(self) -> Dict[str, Any]:
         """Genera la geometría de la elipse"""
-        center = self.get_input_value("center")
-        radius_x = self.get_input_value("radius_x")
-        radius_y = self.get_input_value("radius_y")
-        segments = int(self.get_input_value("segments"))
+        center, radius_x, radius_y, segments = self.snapshot_inputs()
+        segments = int(segments)
         
         if isinstance(center, list):
             center = (center[0], center[1])
         
-        # Crear elipse usando polígono
-        from utils.geometry.base_geometry import Polygon
-        
-        vertices = []
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            x = center[0] + radius_x * math.cos(angle)
-            y = center[1] + radius_y * math.sin(angle)
-            vertices.append((x, y))
-        
-        ellipse = Polygon(vertices)
+        # Crear elipse usando polígono (los vértices se reutilizan si los parámetros se repiten)
+        ellipse = _make_ellipse(center, radius_x, radius_y, segments)
         
         # Calcular área y perímetro aproximados
         area = math.pi * radius_x * radius_y
         # Aproximación de Ramanujan para el perímetro de elipse
-        h = ((radius_x - radius_y) / (radius_x + radius_y)) ** 2
-        perimeter = math.pi * (radius_x + radius_y) * (1 + (3 * h) / (10 + math.sqrt(4 - 3 * h)))
+        radius_sum = radius_x + radius_y
+        ratio = (radius_x - radius_y) / radius_sum
+        h = ratio * ratio
+        perimeter = math.pi * radius_sum * (1 + (3 * h) / (10 + math.sqrt(4 - 3 * h)))
         
         return {
             "geometry": ellipse,
@@ -3,18 +3,62 @@ Nodo generador de rectángulos para GoboFlow
 Genera geometría rectangular con parámetros configurables
 """
 
+import json
 import math
-from typing import Dict, List, Tuple, Any, Optional
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Tuple, Any, Optional, Sequence
 
 from nodes.base.base_node import GeneratorNode
 from core.socket_types import NumberType, VectorType, BooleanType, GeometryType
 
+# orjson es opcional: acelera to_json() cuando está disponible
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Atributos de relleno del <rect> SVG y decimales con que se escriben los números
+_SVG_FILLED_ATTR = 'fill="white" stroke="none"'
+_SVG_OUTLINE_ATTR = 'fill="none" stroke="white" stroke-width="1"'
+SVG_PRECISION = 3
+
+# Constantes de las esquinas redondeadas (área, perímetro y arco)
+_FOUR_MINUS_PI = 4 - math.pi
+_TWO_PI_MINUS_EIGHT = 2 * math.pi - 8
+_HALF_PI = math.pi * 0.5
+
+def _svg_number(value: float) -> str:
+    """Número redondeado a SVG_PRECISION decimales, sin ceros sobrantes"""
+    text = f"{value:.{SVG_PRECISION}f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+@lru_cache(maxsize=128)
+def _quarter_arc(segments: int) -> Tuple[Tuple[float, float], ...]:
+    """
+    Puntos (cos, sin) de un cuarto de círculo unitario, de 0 a π/2, con
+    segments + 1 puntos. Las cuatro esquinas son rotaciones de este arco,
+    así que la trigonometría se calcula una sola vez por número de segmentos.
+    """
+    step = _HALF_PI / segments
+    cos, sin = math.cos, math.sin
+    return tuple([(cos(j * step), sin(j * step)) for j in range(segments + 1)])
+
 class RectangleGeometry:
     """
     Representación de geometría rectangular para GoboFlow
     Soporta esquinas redondeadas y diferentes modos de dimensionado
     """
     
+    __slots__ = ("center", "width", "height", "corner_radius", "filled", "_points",
+                 "geometry_type", "bbox", "_half_w", "_half_h", "_r2", "_area", "_perimeter",
+                 "_svg_cache")
+    
+    # Error máximo (en px) entre el arco de una esquina y sus cuerdas; un
+    # preview puede subirlo para generar menos puntos
+    FLATNESS_TOL = 0.5
+    
     def __init__(self, center: Tuple[float, float] = (0, 0),
                  width: float = 200.0,
                  height: float = 100.0,
@@ -26,18 +70,42 @@ class RectangleGeometry:
         self.corner_radius = max(0.0, min(corner_radius, min(width, height) / 2))
         self.filled = filled
         
-        # Generar puntos del rectángulo
-        self.points = self._generate_rectangle_points()
+        # Semidimensiones y radio al cuadrado, usados por todos los métodos
+        self._half_w = self.width * 0.5
+        self._half_h = self.height * 0.5
+        self._r2 = self.corner_radius * self.corner_radius
+        
+        # Área y perímetro analíticos: cada esquina redondeada quita
+        # r²·(1 - π/4) de área y cambia 2r de lados rectos por un arco de πr/2
+        r = self.corner_radius
+        self._area = self.width * self.height - self._r2 * _FOUR_MINUS_PI
+        self._perimeter = 2 * (self.width + self.height) + r * _TWO_PI_MINUS_EIGHT
+        
+        # Los puntos se generan la primera vez que se piden: SVG, área,
+        # perímetro, bbox y contains_point son analíticos y no los necesitan
+        self._points = None
+        self._svg_cache = None
         
         # Metadatos de geometría
         self.geometry_type = "rectangle"
         self.bbox = self._calculate_bbox()
         
+    @property
+    def points(self) -> List[Tuple[float, float]]:
+        """Puntos del contorno (generados bajo demanda)"""
+        if self._points is None:
+            self._points = self._generate_rectangle_points()
+        return self._points
+    
+    @points.setter
+    def points(self, value: List[Tuple[float, float]]):
+        self._points = value
+    
     def _generate_rectangle_points(self) -> List[Tuple[float, float]]:
         """Genera los puntos del contorno del rectángulo"""
         cx, cy = self.center
-        half_w = self.width / 2
-        half_h = self.height / 2
+        half_w = self._half_w
+        half_h = self._half_h
         
         if self.corner_radius == 0:
             # Rectángulo simple (4 puntos)
@@ -53,8 +121,14 @@ class RectangleGeometry:
             r = self.corner_radius
             
             # Calcular puntos de las esquinas redondeadas
-            # Se generan aproximadamente como polígonos
-            segments_per_corner = max(4, int(r / 5))  # Más segmentos para radios grandes
+            # Se generan aproximadamente como polígonos: cada cuerda abarca el
+            # ángulo 2·acos(1 - tol/r), cuya flecha es exactamente tol
+            tol = self.FLATNESS_TOL
+            if r > tol:
+                chord_angle = 2 * math.acos(1 - tol / r)
+                segments_per_corner = max(4, math.ceil(_HALF_PI / chord_angle))
+            else:
+                segments_per_corner = 4
             
             # Centros de los arcos de las esquinas
             corners = [
@@ -64,25 +138,23 @@ class RectangleGeometry:
                 (cx - half_w + r, cy - half_h + r),  # Top-left
             ]
             
-            # Ángulos iniciales para cada esquina
-            start_angles = [3 * math.pi / 2, 0, math.pi / 2, math.pi]
+            # Cada esquina rota el cuarto de arco unitario según su ángulo
+            # inicial (3π/2, 0, π/2, π): (s, -c), (c, s), (-s, c), (-c, -s)
+            arc = _quarter_arc(segments_per_corner)
+            (tr_x, tr_y), (br_x, br_y), (bl_x, bl_y), (tl_x, tl_y) = corners
             
-            for i, (corner_x, corner_y) in enumerate(corners):
-                start_angle = start_angles[i]
-                
-                for j in range(segments_per_corner + 1):
-                    angle = start_angle + (math.pi / 2) * j / segments_per_corner
-                    x = corner_x + r * math.cos(angle)
-                    y = corner_y + r * math.sin(angle)
-                    points.append((x, y))
+            points.extend([(tr_x + r * s, tr_y - r * c) for c, s in arc])
+            points.extend([(br_x + r * c, br_y + r * s) for c, s in arc])
+            points.extend([(bl_x - r * s, bl_y + r * c) for c, s in arc])
+            points.extend([(tl_x - r * c, tl_y - r * s) for c, s in arc])
             
             return points
     
     def _calculate_bbox(self) -> Tuple[float, float, float, float]:
         """Calcula el bounding box (min_x, min_y, max_x, max_y)"""
         cx, cy = self.center
-        half_w = self.width / 2
-        half_h = self.height / 2
+        half_w = self._half_w
+        half_h = self._half_h
         
         return (
             cx - half_w,  # min_x
@@ -91,102 +163,134 @@ class RectangleGeometry:
             cy + half_h   # max_y
         )
     
+    @classmethod
+    def _from_template(cls, template: 'RectangleGeometry',
+                       center: Tuple[float, float]) -> 'RectangleGeometry':
+        """Copia de una plantilla trasladada a otro centro, sin regenerar puntos"""
+        rectangle = cls.__new__(cls)
+        rectangle.center = center
+        rectangle.width = template.width
+        rectangle.height = template.height
+        rectangle.corner_radius = template.corner_radius
+        rectangle.filled = template.filled
+        rectangle.geometry_type = template.geometry_type
+        rectangle._half_w = template._half_w
+        rectangle._half_h = template._half_h
+        rectangle._r2 = template._r2
+        rectangle._area = template._area
+        rectangle._perimeter = template._perimeter
+        rectangle._svg_cache = None
+        
+        # Trasladar los puntos solo si la plantilla ya los generó
+        if template._points is None:
+            rectangle._points = None
+        else:
+            dx = center[0] - template.center[0]
+            dy = center[1] - template.center[1]
+            rectangle._points = [(x + dx, y + dy) for x, y in template._points]
+        rectangle.bbox = rectangle._calculate_bbox()
+        return rectangle
+    
     def get_svg_path(self) -> str:
-        """Genera un path SVG del rectángulo"""
+        """Genera un path SVG del rectángulo (cacheado; se construye una vez)"""
+        if self._svg_cache is not None:
+            return self._svg_cache
+        
         cx, cy = self.center
-        half_w = self.width / 2
-        half_h = self.height / 2
+        x = _svg_number(cx - self._half_w)
+        y = _svg_number(cy - self._half_h)
         
-        x = cx - half_w
-        y = cy - half_h
+        # rx/ry solo si hay esquinas redondeadas
+        r = self.corner_radius
+        radius_attr = f' rx="{_svg_number(r)}" ry="{_svg_number(r)}"' if r else ""
+        fill_attr = _SVG_FILLED_ATTR if self.filled else _SVG_OUTLINE_ATTR
         
-        if self.corner_radius == 0:
-            # Rectángulo simple
-            if self.filled:
-                return f'<rect x="{x}" y="{y}" width="{self.width}" height="{self.height}" fill="white" stroke="none"/>'
-            else:
-                return f'<rect x="{x}" y="{y}" width="{self.width}" height="{self.height}" fill="none" stroke="white" stroke-width="1"/>'
-        else:
-            # Rectángulo con esquinas redondeadas
-            r = self.corner_radius
-            fill_attr = 'fill="white" stroke="none"' if self.filled else 'fill="none" stroke="white" stroke-width="1"'
-            return f'<rect x="{x}" y="{y}" width="{self.width}" height="{self.height}" rx="{r}" ry="{r}" {fill_attr}/>'
+        self._svg_cache = (f'<rect x="{x}" y="{y}" width="{_svg_number(self.width)}" '
+                           f'height="{_svg_number(self.height)}"{radius_attr} {fill_attr}/>')
+        return self._svg_cache
     
     def get_polygon_points(self) -> List[Tuple[float, float]]:
         """Retorna los puntos como polígono"""
         return self.points.copy()
     
+    def get_coordinate_arrays(self) -> Tuple[array, array]:
+        """
+        Coordenadas del contorno como dos arrays contiguos de doubles (xs, ys),
+        8 bytes por coordenada en vez de un float y una tupla por punto
+        """
+        points = self.points
+        return array('d', [x for x, _ in points]), array('d', [y for _, y in points])
+    
     def contains_point(self, x: float, y: float) -> bool:
         """Verifica si un punto está dentro del rectángulo"""
+        # Posiciones relativas al centro (plegadas al primer cuadrante)
         cx, cy = self.center
-        half_w = self.width / 2
-        half_h = self.height / 2
-        
-        # Verificación básica del rectángulo
-        if not (cx - half_w <= x <= cx + half_w and cy - half_h <= y <= cy + half_h):
-            return False
-        
-        # Si no hay esquinas redondeadas, ya está dentro
-        if self.corner_radius == 0:
-            return True
-        
-        # Verificar esquinas redondeadas
-        r = self.corner_radius
-        
-        # Posiciones relativas al centro
         rel_x = abs(x - cx)
         rel_y = abs(y - cy)
         
-        # Si está en la zona central (no en las esquinas), está dentro
-        if rel_x <= half_w - r or rel_y <= half_h - r:
-            return True
-        
-        # Verificar si está dentro del radio de la esquina
-        corner_x = half_w - r
-        corner_y = half_h - r
+        # Exceso sobre el rectángulo de centros de arco (0 si está dentro en
+        # ese eje); con radio 0 se reduce a la prueba del rectángulo simple
+        dx = rel_x - self._half_w + self.corner_radius
+        dy = rel_y - self._half_h + self.corner_radius
+        dx = dx if dx > 0.0 else 0.0
+        dy = dy if dy > 0.0 else 0.0
         
-        if rel_x > corner_x and rel_y > corner_y:
-            # Está en una de las esquinas, verificar distancia al centro del arco
-            distance_sq = (rel_x - corner_x) ** 2 + (rel_y - corner_y) ** 2
-            return distance_sq <= r ** 2
+        return (rel_x <= self._half_w and rel_y <= self._half_h
+                and dx * dx + dy * dy <= self._r2)
+    
+    def contains_points(self, xs: Sequence[float], ys: Sequence[float]) -> List[bool]:
+        """Versión por lotes de contains_point para muchos puntos"""
+        cx, cy = self.center
+        half_w = self._half_w
+        half_h = self._half_h
+        inner_w = half_w - self.corner_radius
+        inner_h = half_h - self.corner_radius
+        r2 = self._r2
         
-        return True
+        results = []
+        for x, y in zip(xs, ys):
+            rel_x = abs(x - cx)
+            rel_y = abs(y - cy)
+            dx = rel_x - inner_w if rel_x > inner_w else 0.0
+            dy = rel_y - inner_h if rel_y > inner_h else 0.0
+            results.append(rel_x <= half_w and rel_y <= half_h and dx * dx + dy * dy <= r2)
+        return results
     
     def get_area(self) -> float:
-        """Calcula el área del rectángulo"""
-        if self.corner_radius == 0:
-            return self.width * self.height
-        else:
-            # Área del rectángulo menos las esquinas + área de los cuartos de círculo
-            r = self.corner_radius
-            rect_area = self.width * self.height
-            corner_area_removed = 4 * (r * r - math.pi * r * r / 4)
-            return rect_area - corner_area_removed
+        """Área del rectángulo (calculada en el constructor)"""
+        return self._area
     
     def get_perimeter(self) -> float:
-        """Calcula el perímetro del rectángulo"""
-        if self.corner_radius == 0:
-            return 2 * (self.width + self.height)
-        else:
-            # Perímetro de los lados rectos + arcos de las esquinas
-            r = self.corner_radius
-            straight_length = 2 * (self.width - 2 * r) + 2 * (self.height - 2 * r)
-            arc_length = 2 * math.pi * r  # 4 cuartos de círculo = círculo completo
-            return straight_length + arc_length
+        """Perímetro del rectángulo (calculado en el constructor)"""
+        return self._perimeter
     
     def to_dict(self) -> Dict[str, Any]:
-        """Serializa la geometría a diccionario"""
+        """
+        Serializa la geometría a diccionario
+        Solo guarda los parámetros: puntos y bbox se regeneran al cargar
+        """
         return {
             "type": "rectangle",
             "center": self.center,
             "width": self.width,
             "height": self.height,
             "corner_radius": self.corner_radius,
-            "filled": self.filled,
-            "points": self.points,
-            "bbox": self.bbox
+            "filled": self.filled
         }
     
+    def to_json(self) -> bytes:
+        """Serializa la geometría a JSON (con orjson si está instalado)"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+    
+    def __getstate__(self):
+        """Estado compacto para pickle/copy: solo los parámetros"""
+        return (self.center, self.width, self.height, self.corner_radius, self.filled)
+    
+    def __setstate__(self, state):
+        self.__init__(*state)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RectangleGeometry':
         """Deserializa geometría desde diccionario"""
@@ -204,10 +308,21 @@ class RectangleNode(GeneratorNode):
     Crea geometría rectangular con esquinas redondeadas opcionales
     """
     
+    # Atributos propios del nodo en slots; los no declarados (p. ej. los que
+    # añade la UI) van al __dict__ que conserva Node
+    __slots__ = ("_last_geometry", "_last_key")
+    
     NODE_TYPE = "rectangle"
     NODE_TITLE = "Rectangle"
     NODE_DESCRIPTION = "Generates a rectangular shape with optional rounded corners"
     
+    # Inputs numéricos: (posición en snapshot_inputs, nombre, valor por defecto, mínimo)
+    _NUMBER_INPUTS = (
+        (0, "width", 200.0, 1.0),
+        (1, "height", 100.0, 1.0),
+        (3, "corner_radius", 0.0, 0.0),
+    )
+    
     def __init__(self, title: Optional[str] = None):
         super().__init__(title)
         
@@ -219,6 +334,10 @@ class RectangleNode(GeneratorNode):
         self.set_parameter("corner_radius", 0.0)
         self.set_parameter("filled", True)
         
+        # Última geometría generada y los parámetros que la produjeron
+        self._last_geometry = None
+        self._last_key = None
+        
     def _init_sockets(self):
         """Inicializa los sockets del nodo rectángulo"""
         # Inputs para parámetros del rectángulo
@@ -240,11 +359,13 @@ class RectangleNode(GeneratorNode):
     def generate_geometry(self) -> RectangleGeometry:
         """Genera la geometría del rectángulo"""
         # Obtener valores de inputs o parámetros internos
-        width = self._get_width()
-        height = self._get_height()
-        center = self._get_center()
-        corner_radius = self._get_corner_radius()
-        filled = self._get_filled()
+        key = self._resolve_inputs()
+        
+        # Reutilizar la geometría si los parámetros no cambiaron
+        if key == self._last_key:
+            return self._last_geometry
+        
+        width, height, center, corner_radius, filled = key
         
         # Crear geometría del rectángulo
         rectangle = RectangleGeometry(
@@ -255,67 +376,50 @@ class RectangleNode(GeneratorNode):
             filled=filled
         )
         
+        self._last_geometry = rectangle
+        self._last_key = key
         return rectangle
     
-    def _get_width(self) -> float:
-        """Obtiene el ancho desde input o parámetro"""
-        input_width = self.get_input_value("width")
-        if input_width is not None:
-            try:
-                width = float(input_width)
-                return max(1.0, width)  # Mínimo 1px
-            except (ValueError, TypeError):
-                pass
-        return self.get_parameter("width", 200.0)
-    
-    def _get_height(self) -> float:
-        """Obtiene la altura desde input o parámetro"""
-        input_height = self.get_input_value("height")
-        if input_height is not None:
-            try:
-                height = float(input_height)
-                return max(1.0, height)  # Mínimo 1px
-            except (ValueError, TypeError):
-                pass
-        return self.get_parameter("height", 100.0)
-    
-    def _get_center(self) -> Tuple[float, float]:
-        """Obtiene el centro desde input o parámetros"""
-        input_center = self.get_input_value("center")
-        if input_center is not None:
+    def _resolve_inputs(self) -> Tuple[float, float, Tuple[float, float], float, bool]:
+        """
+        Lee todos los inputs en una sola pasada y los valida
+        Retorna (width, height, center, corner_radius, filled)
+        """
+        raw = self.snapshot_inputs()  # Orden de declaración de los sockets
+        
+        width, height, corner_radius = [
+            self._resolve_number(raw[index], name, default, minimum)
+            for index, name, default, minimum in self._NUMBER_INPUTS
+        ]
+        
+        # Centro desde input o parámetros internos
+        center = raw[2]
+        if isinstance(center, (list, tuple)) and len(center) >= 2:
             try:
-                if isinstance(input_center, (list, tuple)) and len(input_center) >= 2:
-                    return (float(input_center[0]), float(input_center[1]))
+                center = (float(center[0]), float(center[1]))
             except (ValueError, TypeError):
-                pass
+                center = None
+        else:
+            center = None
+        if center is None:
+            center = (self.get_parameter("center_x", 0.0), self.get_parameter("center_y", 0.0))
+        
+        # Relleno desde input o parámetro
+        filled = raw[4]
+        filled = self.get_parameter("filled", True) if filled is None else bool(filled)
         
-        # Usar parámetros internos
-        x = self.get_parameter("center_x", 0.0)
-        y = self.get_parameter("center_y", 0.0)
-        return (x, y)
+        return width, height, center, corner_radius, filled
     
-    def _get_corner_radius(self) -> float:
-        """Obtiene el radio de esquina desde input o parámetro"""
-        input_radius = self.get_input_value("corner_radius")
-        if input_radius is not None:
-            try:
-                radius = float(input_radius)
-                return max(0.0, radius)  # No negativo
-            except (ValueError, TypeError):
-                pass
-        return self.get_parameter("corner_radius", 0.0)
-    
-    def _get_filled(self) -> bool:
-        """Obtiene si está relleno desde input o parámetro"""
-        input_filled = self.get_input_value("filled")
-        if input_filled is not None:
-            if isinstance(input_filled, bool):
-                return input_filled
-            try:
-                return bool(input_filled)
-            except (ValueError, TypeError):
-                pass
-        return self.get_parameter("filled", True)
+    def _resolve_number(self, value: Any, name: str, default: float, minimum: float) -> float:
+        """Valor numérico desde input (limitado a minimum) o desde parámetro"""
+        if value is not None:
+            if not isinstance(value, (int, float)):
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    return self.get_parameter(name, default)
+            return value if value > minimum else minimum
+        return self.get_parameter(name, default)
     
     def compute(self) -> Dict[str, Any]:
         """Computa todos los outputs del nodo"""
@@ -339,16 +443,17 @@ class RectangleNode(GeneratorNode):
     def get_preview_info(self) -> Dict[str, Any]:
         """Información para preview en la UI"""
         try:
-            rectangle = self.generate_geometry()
+            # Usa el cache del nodo: solo recalcula si está dirty
+            rectangle = self.get_output_value("geometry")
             return {
                 "type": "rectangle",
                 "center": rectangle.center,
                 "width": rectangle.width,
                 "height": rectangle.height,
                 "corner_radius": rectangle.corner_radius,
-                "area": rectangle.get_area(),
-                "perimeter": rectangle.get_perimeter(),
-                "aspect_ratio": rectangle.width / rectangle.height,
+                "area": self.get_output_value("area"),
+                "perimeter": self.get_output_value("perimeter"),
+                "aspect_ratio": self.get_output_value("aspect_ratio"),
                 "filled": rectangle.filled
             }
         except Exception:
@@ -393,49 +498,77 @@ class RectangleNode(GeneratorNode):
 def create_rectangle_grid(rows: int, cols: int, spacing_x: float, spacing_y: float, 
                          width: float, height: float) -> List[RectangleGeometry]:
     """Crea una grilla de rectángulos"""
-    rectangles = []
-    
     start_x = -(cols - 1) * spacing_x / 2
     start_y = -(rows - 1) * spacing_y / 2
     
-    for row in range(rows):
-        for col in range(cols):
-            x = start_x + col * spacing_x
-            y = start_y + row * spacing_y
-            rectangle = RectangleGeometry(center=(x, y), width=width, height=height)
-            rectangles.append(rectangle)
+    # Coordenadas de columnas y filas, calculadas una sola vez
+    xs = [start_x + col * spacing_x for col in range(cols)]
+    ys = [start_y + row * spacing_y for row in range(rows)]
     
-    return rectangles
+    # Todos comparten dimensiones: se genera uno y el resto son copias trasladadas
+    template = RectangleGeometry(center=(0.0, 0.0), width=width, height=height)
+    from_template = RectangleGeometry._from_template
+    
+    return [from_template(template, (x, y)) for y in ys for x in xs]
 
 def create_concentric_rectangles(center: Tuple[float, float], 
                                min_size: Tuple[float, float],
                                max_size: Tuple[float, float], 
                                count: int) -> List[RectangleGeometry]:
     """Crea rectángulos concéntricos"""
-    rectangles = []
     min_w, min_h = min_size
-    max_w, max_h = max_size
+    delta_w = max_size[0] - min_w
+    delta_h = max_size[1] - min_h
     
-    for i in range(count):
-        t = i / (count - 1) if count > 1 else 0
-        width = min_w + (max_w - min_w) * t
-        height = min_h + (max_h - min_h) * t
-        
-        rectangle = RectangleGeometry(center=center, width=width, height=height, filled=False)
-        rectangles.append(rectangle)
+    # Parámetro normalizado de cada rectángulo, calculado de una vez
+    scale = 1 / (count - 1) if count > 1 else 0
+    ts = [i * scale for i in range(count)]
     
-    return rectangles
+    return [RectangleGeometry(center=center, width=min_w + delta_w * t,
+                              height=min_h + delta_h * t, filled=False)
+            for t in ts]
 
 def rectangle_intersects_rectangle(rect1: RectangleGeometry, rect2: RectangleGeometry) -> bool:
     """Verifica si dos rectángulos se intersectan"""
-    bbox1 = rect1.bbox
-    bbox2 = rect2.bbox
+    min_x1, min_y1, max_x1, max_y1 = rect1.bbox
+    min_x2, min_y2, max_x2, max_y2 = rect2.bbox
     
     # Verificar si los bounding boxes se intersectan
-    return not (bbox1[2] < bbox2[0] or  # rect1.max_x < rect2.min_x
-                bbox1[0] > bbox2[2] or  # rect1.min_x > rect2.max_x
-                bbox1[3] < bbox2[1] or  # rect1.max_y < rect2.min_y
-                bbox1[1] > bbox2[3])    # rect1.min_y > rect2.max_y
+    return (max_x1 >= min_x2 and min_x1 <= max_x2 and
+            max_y1 >= min_y2 and min_y1 <= max_y2)
+
+def bboxes_intersect(bboxes_a: Sequence[Tuple[float, float, float, float]],
+                     bboxes_b: Sequence[Tuple[float, float, float, float]]) -> List[bool]:
+    """Versión por lotes: intersección de cada par (bboxes_a[i], bboxes_b[i])"""
+    return [max_x1 >= min_x2 and min_x1 <= max_x2 and max_y1 >= min_y2 and min_y1 <= max_y2
+            for (min_x1, min_y1, max_x1, max_y1), (min_x2, min_y2, max_x2, max_y2)
+            in zip(bboxes_a, bboxes_b)]
+
+def rectangle_intersection_pairs(rectangles: Sequence[RectangleGeometry]) -> List[Tuple[int, int]]:
+    """
+    Índices (i, j) con i < j de todos los pares de rectángulos que se
+    intersectan (mismo criterio que rectangle_intersects_rectangle).
+    Barrido sobre min_x: solo se comparan rectángulos que se solapan en x.
+    """
+    order = sorted(range(len(rectangles)), key=lambda i: rectangles[i].bbox[0])
+    active = []  # (max_x, índice, bbox) de los rectángulos aún abiertos en x
+    pairs = []
+    
+    for j in order:
+        bbox = rectangles[j].bbox
+        min_x, min_y, _, max_y = bbox
+        
+        # Descartar los que terminaron antes de este min_x
+        active = [entry for entry in active if entry[0] >= min_x]
+        
+        for _, i, other in active:
+            if not (other[3] < min_y or other[1] > max_y):
+                pairs.append((i, j) if i < j else (j, i))
+        
+        active.append((bbox[2], j, bbox))
+    
+    pairs.sort()
+    return pairs
 
 # Registro del nodo
 RECTANGLE_NODE_REGISTRY = {
@@ -0,0 +1,74 @@
+"""
+Pruebas del cache de resultados compartido por los nodos de un grafo
+"""
+
+from core.node_system import NodeGraph
+from nodes.base.base_node import MergeNode
+from nodes.primitives.circle_node import CircleNode
+
+
+def _merge_of(graph, source):
+    merge = MergeNode()
+    graph.add_node(merge)
+    graph.connect_nodes(source.id, "geometry", merge.id, "geometry1")
+    return merge
+
+
+def test_nodes_with_same_inputs_share_result():
+    graph = NodeGraph()
+    first, second = MergeNode(), MergeNode()
+    graph.add_node(first)
+    graph.add_node(second)
+
+    first.get_output_value("geometry")
+    second.get_output_value("geometry")
+
+    assert first._shared_key() == second._shared_key()
+    assert len(graph.result_cache) == 1
+
+
+def test_shared_result_invalidated_by_upstream_change():
+    graph = NodeGraph()
+    circle = CircleNode()
+    graph.add_node(circle)
+    merge = _merge_of(graph, circle)
+    assert merge.get_output_value("geometry").radius == 100.0
+
+    circle.input_sockets["radius"].default_value = 25.0
+    circle.mark_dirty()
+
+    assert merge.get_output_value("geometry").radius == 25.0
+
+
+def test_shared_result_invalidated_by_reconnection():
+    graph = NodeGraph()
+    small, large = CircleNode(), CircleNode()
+    small.input_sockets["radius"].default_value = 10.0
+    graph.add_node(small)
+    graph.add_node(large)
+    merge = _merge_of(graph, small)
+    connection = next(iter(graph.connections))
+    assert merge.get_output_value("geometry").radius == 10.0
+
+    graph.disconnect(connection)
+    graph.connect_nodes(large.id, "geometry", merge.id, "geometry1")
+
+    assert merge.get_output_value("geometry").radius == 100.0
+
+
+def test_cache_is_per_graph_and_cleared():
+    graph, other = NodeGraph(), NodeGraph()
+    circle = CircleNode()
+    graph.add_node(circle)
+    merge = _merge_of(graph, circle)
+    merge.get_output_value("geometry")
+
+    assert len(graph.result_cache) == 1
+    assert len(other.result_cache) == 0
+
+    graph.remove_node(merge.id)
+    assert len(graph.result_cache) == 0
+
+    _merge_of(graph, circle).get_output_value("geometry")
+    graph.clear()
+    assert len(graph.result_cache) == 0
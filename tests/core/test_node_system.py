@@ -0,0 +1,122 @@
+"""
+Pruebas del sistema de nodos: invalidación de resultados memoizados,
+invalidación durante un cálculo y ejecución del grafo mientras cambia su estructura
+"""
+
+from core.node_system import Node, NodeGraph, NodeState
+from core.socket_types import NUMBER
+from nodes.base.base_node import MathNode, NumberParameterNode
+
+
+class EditedDuringComputeNode(Node):
+    """Nodo que simula un cambio de parámetro desde la GUI a mitad de compute()"""
+
+    NODE_TYPE = "test_edited_during_compute"
+
+    def __init__(self):
+        self.value = 1.0
+        self.edit_on_compute = None
+        super().__init__()
+
+    def _init_sockets(self):
+        self.add_output("value", NUMBER)
+
+    def compute(self):
+        value = self.value
+        if self.edit_on_compute is not None:
+            self.value, self.edit_on_compute = self.edit_on_compute, None
+            self.mark_dirty()
+        return {"value": value}
+
+
+class GrowingNode(Node):
+    """Nodo que añade otro nodo al grafo mientras se ejecuta"""
+
+    NODE_TYPE = "test_growing"
+
+    def __init__(self, graph):
+        self.graph = graph
+        super().__init__()
+
+    def _init_sockets(self):
+        self.add_output("value", NUMBER)
+
+    def compute(self):
+        self.graph.add_node(EditedDuringComputeNode())
+        return {"value": 0.0}
+
+
+def test_mark_dirty_during_compute_keeps_node_dirty():
+    node = EditedDuringComputeNode()
+    node.edit_on_compute = 2.0
+
+    node.evaluate()
+
+    assert node.state == NodeState.DIRTY
+    assert node.get_output_value("value") == 2.0
+    assert node.state == NodeState.CLEAN
+
+
+def test_execute_parallel_tolerates_nodes_added_during_run():
+    graph = NodeGraph()
+    graph.add_node(GrowingNode(graph))
+    graph.add_node(GrowingNode(graph))
+
+    executed = graph.execute_parallel()
+
+    assert len(executed) == 2
+    assert len(graph.nodes) == 4
+
+
+def test_execute_parallel_reuses_its_thread_pool():
+    graph = NodeGraph()
+    for _ in range(NodeGraph.PARALLEL_MIN_LAYER):
+        graph.add_node(EditedDuringComputeNode())
+
+    graph.execute_parallel()
+    executor = graph._executor
+    for node in graph.nodes.values():
+        node.mark_dirty()
+    executed = graph.execute_parallel()
+
+    assert executor is not None
+    assert graph._executor is executor
+    assert all(node.state == NodeState.CLEAN for node in executed)
+
+
+def _math_graph():
+    graph = NodeGraph()
+    a, b, math_node = NumberParameterNode(), NumberParameterNode(), MathNode()
+    for node in (a, b, math_node):
+        graph.add_node(node)
+    a.set_parameter("value", 2.0)
+    b.set_parameter("value", 3.0)
+    graph.connect_nodes(a.id, "value", math_node.id, "a")
+    graph.connect_nodes(b.id, "value", math_node.id, "b")
+    return graph, a, b, math_node
+
+
+def test_memoized_result_invalidated_by_parameter_change():
+    graph, a, b, math_node = _math_graph()
+    assert math_node.get_output_value("result") == 5.0
+
+    a.set_parameter("value", 10.0)
+
+    assert math_node.state == NodeState.DIRTY
+    assert math_node.get_output_value("result") == 13.0
+
+
+def test_memoized_result_invalidated_by_reconnection():
+    graph, a, b, math_node = _math_graph()
+    assert math_node.get_output_value("result") == 5.0
+
+    connection_id = next(connection.id for connection in graph.connections.values()
+                         if connection.output_socket.node is a)
+    graph.disconnect(connection_id)
+    assert math_node.get_output_value("result") == 3.0
+
+    c = NumberParameterNode()
+    c.set_parameter("value", 7.0)
+    graph.add_node(c)
+    graph.connect_nodes(c.id, "value", math_node.id, "a")
+    assert math_node.get_output_value("result") == 10.0
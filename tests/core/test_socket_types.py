@@ -0,0 +1,26 @@
+"""
+Pruebas de los tipos de socket: colores empaquetados RGBA8888
+"""
+
+from core.socket_types import COLOR, pack_rgba, unpack_rgba
+
+
+def test_pack_unpack_round_trip():
+    for packed in (0x00000000, 0xFFFFFFFF, 0x12345678, 0xFF8000C0):
+        assert pack_rgba(unpack_rgba(packed)) == packed
+
+
+def test_unpack_pack_round_trip_on_byte_levels():
+    color = {'r': 1.0, 'g': 128 / 255, 'b': 0.0, 'a': 64 / 255}
+    assert unpack_rgba(pack_rgba(color)) == color
+
+
+def test_pack_clamps_out_of_range_channels():
+    assert pack_rgba({'r': 2.0, 'g': -1.0, 'b': 0.5, 'a': 1.0}) == 0xFF0080FF
+
+
+def test_color_type_accepts_packed_ints():
+    assert COLOR.validate_value(0xFF0000FF)
+    assert COLOR.convert_value(0xFF0000FF) == {'r': 1.0, 'g': 0.0, 'b': 0.0, 'a': 1.0}
+    assert not COLOR.validate_value(-1)
+    assert not COLOR.validate_value(True)
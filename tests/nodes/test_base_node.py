@@ -0,0 +1,116 @@
+"""
+Pruebas de los nodos base: valores y resultados propios de cada instancia
+"""
+
+import copy
+import json
+import math
+
+import pytest
+
+from core.socket_types import GEOMETRY, NUMBER
+from nodes.base.base_node import (
+    ColorParameterNode, GeneratorNode, InfoNode, MathNode, NumberParameterNode,
+    TransformNode, VectorParameterNode, ViewerNode
+)
+from utils.geometry.base_geometry import Polygon
+
+
+def test_number_parameter_outputs_its_value():
+    node = NumberParameterNode("Test Number")
+    node.set_parameter("value", 42.5)
+
+    assert node.compute()["value"] == 42.5
+
+
+def test_viewer_exposes_display_outputs():
+    result = ViewerNode("Test Viewer").compute()
+
+    assert result == {"display_geometry": None, "display_color": None, "display_opacity": 1.0}
+
+
+def test_math_node_adds_its_inputs():
+    node = MathNode("Test Math")
+    node.add_input("a", NUMBER, 5.0)
+    node.add_input("b", NUMBER, 3.0)
+
+    assert node.compute()["result"] == 8.0
+
+
+def test_color_parameter_default_is_plain_dict():
+    node = ColorParameterNode()
+    value = node.get_output_value("value")
+
+    assert type(value) is dict
+    assert json.loads(json.dumps(value)) == {'r': 1.0, 'g': 1.0, 'b': 1.0, 'a': 1.0}
+    assert copy.deepcopy(value) == value
+    assert value is not ColorParameterNode().parameter_value
+
+
+def test_info_without_geometry_uses_lists():
+    node = InfoNode()
+
+    assert node.get_output_value("center") == [0.0, 0.0]
+    assert node.get_output_value("bounds") == [0.0, 0.0]
+
+
+def test_vector_component_edit_does_not_mutate_previous_output():
+    node = VectorParameterNode()
+    before = node.get_output_value("value")
+
+    node.set_parameter("x", 3.0)
+
+    assert before == [0.0, 0.0]
+    assert node.get_output_value("value") == [3.0, 0.0]
+
+
+def test_viewer_and_info_return_new_result_per_compute():
+    for node in (ViewerNode(), InfoNode()):
+        first = node.compute()
+        second = node.compute()
+
+        assert first is not second
+        assert first == second
+
+
+def test_generator_node_requires_generate_geometry():
+    class Incomplete(GeneratorNode):
+        def _init_sockets(self):
+            self.add_output("geometry", GEOMETRY)
+
+    class Complete(Incomplete):
+        def generate_geometry(self):
+            return self.get_parameter("shape")
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    node = Complete()
+    node.set_parameter("shape", "square")
+    assert node.get_output_value("geometry") == "square"
+
+
+class _TagTransformNode(TransformNode):
+    NODE_TYPE = "test_tag_transform"
+
+    def apply_transform(self, geometry, translation, rotation, scale):
+        return ("transformed", geometry)
+
+
+def test_transform_batch_applies_affine_transform_to_geometries():
+    square = Polygon([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+    node = _TagTransformNode()
+
+    moved, rotated, other = node.apply_transform_batch(
+        [square, square, "raw"],
+        [((1.0, 2.0), 0.0, (1.0, 1.0)),
+         ((1.0, 2.0), math.pi / 2, (2.0, 2.0)),
+         ((0.0, 0.0), 0.0, (1.0, 1.0))],
+    )
+
+    assert moved.vertices == [(1.0, 2.0), (2.0, 2.0), (2.0, 3.0), (1.0, 3.0)]
+    expected = [(2.5, 1.5), (2.5, 3.5), (0.5, 3.5), (0.5, 1.5)]
+    for (x, y), (ex, ey) in zip(rotated.vertices, expected):
+        assert x == pytest.approx(ex) and y == pytest.approx(ey)
+    assert square.vertices[0] == (0.0, 0.0)
+    assert other == ("transformed", "raw")
@@ -0,0 +1,30 @@
+"""
+Pruebas de los nodos de círculo: la geometría de salida de un nodo no debe
+compartirse con otros nodos que tengan los mismos parámetros
+"""
+
+from nodes.primitives.circle_node import CircleNode, EllipseNode
+
+
+def test_circle_output_is_not_shared_between_nodes():
+    first = CircleNode()
+    modified = first.get_output_value("geometry")
+    modified.set_radius(5)
+
+    second = CircleNode()
+    geometry = second.get_output_value("geometry")
+
+    assert geometry is not modified
+    assert geometry.radius == 100.0
+
+
+def test_ellipse_output_is_not_shared_between_nodes():
+    first = EllipseNode()
+    modified = first.get_output_value("geometry")
+    modified.vertices[0] = (0.0, 0.0)
+
+    second = EllipseNode()
+    geometry = second.get_output_value("geometry")
+
+    assert geometry is not modified
+    assert geometry.vertices[0] == (100.0, 0.0)
@@ -3,30 +3,32 @@ Módulo UI de GoboFlow
 Inicialización del sistema de interfaz de usuario
 """
 
-# Verificar disponibilidad de PyQt6
-try:
-    from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtCore import Qt
-    UI_AVAILABLE = True
-    
-    # Importar componentes UI si están disponibles
+import logging
+from importlib.util import find_spec
+
+log = logging.getLogger(__name__)
+
+# Verificar disponibilidad de PyQt6 sin importarlo: Qt solo se carga cuando
+# se lanza la GUI
+UI_AVAILABLE = find_spec("PyQt6") is not None
+if not UI_AVAILABLE:
+    log.debug("PyQt6 no disponible - modo GUI deshabilitado")
+
+def run_gui():
+    """
+    Ejecuta la GUI completa. La ventana principal se importa aquí, así que
+    importar el paquete ui no carga el editor si no se usa la GUI.
+    """
+    if not UI_AVAILABLE:
+        log.error("GUI no disponible. Instala PyQt6 con: pip install PyQt6")
+        return 1
+
     try:
-        from .main_window import run_gui
-        print("✅ GUI completa disponible")
+        from .main_window import run_gui as run_main_window
     except ImportError as e:
-        print(f"⚠️ GUI completa no disponible: {e}")
-        print("🔄 Usando GUI simplificada")
-        
-        def run_gui():
-            print("❌ GUI completa no implementada")
-            return 1
-    
-except ImportError:
-    UI_AVAILABLE = False
-    print("⚠️ PyQt6 no disponible - modo GUI deshabilitado")
-    
-    def run_gui():
-        print("❌ GUI no disponible. Instala PyQt6 con: pip install PyQt6")
+        log.error("GUI completa no disponible: %s", e)
         return 1
 
-__all__ = ['UI_AVAILABLE', 'run_gui']
\ No newline at end of file
+    return run_main_window()
+
+__all__ = ['UI_AVAILABLE', 'run_gui']
@@ -3,42 +3,31 @@ Ventana principal mejorada de GoboFlow
 Incluye el editor visual de nodos funcional
 """
 
+import logging
 import sys
+from collections import defaultdict
+from functools import lru_cache, partial
+from importlib import import_module
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QSplitter, QLabel, QPushButton, QMessageBox, QFrame, QStatusBar,
         QMenuBar, QMenu, QToolBar, QFileDialog
     )
-    from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-    from PyQt6.QtGui import QAction, QKeySequence
+    from PyQt6.QtCore import (
+        Qt, pyqtSignal, pyqtSlot, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker
+    )
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
-    print("⚠️ PyQt6 no disponible")
+    log.debug("PyQt6 no disponible")
 
 # Imports de GoboFlow
 
-try:
-    from ui.viewport_widget import create_viewport_widget
-    VIEWPORT_AVAILABLE = True
-    print("✅ Viewport widget disponible")
-except ImportError as e:
-    VIEWPORT_AVAILABLE = False
-    create_viewport_widget = None
-    print(f"⚠️ Viewport widget no disponible: {e}")
-
-try:
-    from ui.properties_panel import create_properties_panel as create_props_panel
-    PROPERTIES_AVAILABLE = True
-    print("✅ Properties panel disponible")
-except ImportError as e:
-    PROPERTIES_AVAILABLE = False
-    create_props_panel = None
-    print(f"⚠️ Properties panel no disponible: {e}")
-
 try:
     from config import APP_NAME, APP_VERSION, USER_CONFIG_DIR
 except ImportError:
@@ -46,59 +35,224 @@ except ImportError:
     APP_VERSION = "0.1.0"
     USER_CONFIG_DIR = Path.home() / ".goboflow"
 
-# Importar editor de nodos
-try:
-    from ui.node_editor import create_node_editor, NODE_EDITOR_AVAILABLE
-    print("✅ Editor de nodos disponible")
-except ImportError as e:
-    NODE_EDITOR_AVAILABLE = False
-    create_node_editor = None
-    print(f"⚠️ Editor de nodos no disponible: {e}")
+# Módulos de paneles opcionales (editor, viewport, propiedades): se importan
+# la primera vez que la ventana crea el panel, no al importar este módulo
+_LAZY_MODULES = {}
 
-try:
-    from ui.viewport_widget import create_viewport_widget
-    VIEWPORT_AVAILABLE = True
-    print("✅ Viewport widget disponible")
-except ImportError as e:
-    VIEWPORT_AVAILABLE = False
-    create_viewport_widget = None
-    print(f"⚠️ Viewport widget no disponible: {e}")
+def _lazy(module_name: str):
+    """Importa un módulo opcional una sola vez; None si no está disponible"""
+    if module_name not in _LAZY_MODULES:
+        try:
+            _LAZY_MODULES[module_name] = import_module(module_name)
+            log.debug("%s disponible", module_name)
+        except ImportError as e:
+            _LAZY_MODULES[module_name] = None
+            log.debug("%s no disponible: %s", module_name, e)
+    return _LAZY_MODULES[module_name]
 
-try:
-    from ui.properties_panel import create_properties_panel as create_props_panel
-    PROPERTIES_AVAILABLE = True
-    print("✅ Properties panel disponible")
-except ImportError as e:
-    PROPERTIES_AVAILABLE = False
-    create_props_panel = None
-    print(f"⚠️ Properties panel no disponible: {e}")
+def create_viewport_widget(parent=None):
+    """Crea el viewport, o un placeholder si no está disponible"""
+    module = _lazy("ui.viewport_widget")
+    if module is not None:
+        return module.create_viewport_widget(parent)
+    
+    widget = QWidget(parent)
+    layout = QVBoxLayout(widget)
+    label = QLabel("Vista previa próximamente")
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    label.setStyleSheet("color: #888; font-size: 16px; background: #2b2b2b;")
+    layout.addWidget(label)
+    return widget
+
+@lru_cache(maxsize=256)
+def _node_info_text(title: str, node_type: str, category: str, node_id: str) -> str:
+    """Texto de información de un nodo seleccionado (cacheado por nodo)"""
+    return "📋 %s\nTipo: %s\nCategoría: %s\nID: %s..." % (
+        title, node_type, category, node_id[:8]
+    )
+
+# Marca de "aún no buscado" para los nodos de vista previa cacheados
+_NOT_SCANNED = object()
 
-# Asegurar compatibilidad
-if not VIEWPORT_AVAILABLE:
-    def create_viewport_widget(parent=None):
-        from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
-        from PyQt6.QtCore import Qt
-        
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        label = QLabel("Vista previa próximamente")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("color: #888; font-size: 16px; background: #2b2b2b;")
-        layout.addWidget(label)
-        return widget
+# Tipos de nodo que producen geometría para la vista previa
+_GEOMETRY_NODE_TYPES = ('circle', 'rectangle', 'polygon')
 
-if not PROPERTIES_AVAILABLE:
-    def create_props_panel(parent=None):
-        from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
-        from PyQt6.QtCore import Qt
-        
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        label = QLabel("Panel de propiedades próximamente")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("color: #888; font-size: 12px; background: #353535;")
-        layout.addWidget(label)
-        return widget
+# Categorías de la biblioteca de nodos: (título, nombres de nodo)
+_NODE_CATEGORIES = (
+    ("🎯 Primitivas", ("Círculo", "Rectángulo", "Polígono")),
+    ("📊 Parámetros", ("Número", "Vector", "Color")),
+    ("🔧 Modificadores", ("Transformar", "Array", "Escalar")),
+    ("🔀 Operaciones", ("Unir", "Dividir", "Booleanas")),
+    ("📤 Salidas", ("Visor", "Exportar")),
+)
+
+# Mensajes de la barra de estado para nodos aún no disponibles
+_SOON = {
+    node_name: f"{node_name} - Próximamente"
+    for _, nodes in _NODE_CATEGORIES for node_name in nodes
+}
+
+# SVG básico de exportación, codificado una sola vez
+_SVG_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" 
+     width="1024" height="1024" 
+     viewBox="0 0 1024 1024"
+     style="background: black;">
+  
+  <!-- Gobo generado por GoboFlow -->
+  <circle cx="512" cy="512" r="200" fill="white" opacity="0.8"/>
+  
+  <text x="50" y="980" fill="white" font-family="Arial" font-size="24">
+    GoboFlow - Editor Visual
+  </text>
+  
+</svg>'''.encode('utf-8')
+
+# Contenido del diálogo "Acerca de", formateado una sola vez
+_ABOUT_HTML = f"""
+<h3>{APP_NAME} v{APP_VERSION}</h3>
+<p><b>Generador procedural de gobos para iluminación teatral</b></p>
+
+<p><b>Características:</b></p>
+<ul>
+<li>✅ Editor visual de nodos</li>
+<li>✅ Sistema de conexiones drag & drop</li>
+<li>✅ Generación procedural de geometrías</li>
+<li>✅ Exportación SVG de alta calidad</li>
+<li>🔄 Viewport en tiempo real (próximamente)</li>
+<li>🔄 Más tipos de nodos (próximamente)</li>
+</ul>
+
+<p><b>Controles del Editor:</b></p>
+<ul>
+<li>• Arrastra nodos para moverlos</li>
+<li>• Haz clic en sockets (círculos) para conectar</li>
+<li>• Ctrl + Rueda del mouse para zoom</li>
+<li>• Botón medio para pan</li>
+<li>• Delete para eliminar seleccionados</li>
+<li>• Escape para cancelar conexiones</li>
+</ul>
+
+<p>Desarrollado con Python y PyQt6</p>
+<p><a href="https://github.com/eliasdiaz3d/GoboFlow">GitHub</a></p>
+"""
+
+# Hoja de estilos del tema oscuro (aplicada una vez a la QApplication)
+_DARK_QSS = """
+QMainWindow {
+    background-color: #2b2b2b;
+    color: white;
+}
+QWidget {
+    background-color: #2b2b2b;
+    color: white;
+}
+QFrame {
+    background-color: #353535;
+    border: 1px solid #555;
+}
+QMenuBar {
+    background-color: #404040;
+    border-bottom: 1px solid #555;
+}
+QMenuBar::item:selected {
+    background-color: #0078d4;
+}
+QMenu {
+    background-color: #404040;
+    border: 1px solid #555;
+}
+QMenu::item:selected {
+    background-color: #0078d4;
+}
+QToolBar {
+    background-color: #404040;
+    border: 1px solid #555;
+    spacing: 3px;
+}
+QStatusBar {
+    background-color: #404040;
+    border-top: 1px solid #555;
+}
+QPushButton {
+    background: #505050;
+    border: 1px solid #606060;
+    border-radius: 3px;
+    padding: 5px 10px;
+    color: white;
+}
+QPushButton:hover {
+    background: #606060;
+}
+QPushButton:pressed {
+    background: #0078d4;
+}
+QLabel {
+    color: white;
+}
+QLabel#panelTitle {
+    font-weight: bold;
+    font-size: 14px;
+    padding: 10px;
+    background: #404040;
+}
+QLabel#sectionTitle {
+    font-weight: bold;
+    color: #00aaff;
+}
+QLabel#catLabel {
+    font-weight: bold;
+    color: #00aaff;
+    margin-top: 10px;
+}
+QPushButton#nodeLibBtn {
+    text-align: left;
+    padding: 8px;
+    margin: 1px;
+    border: 1px solid #555;
+    background: #2b2b2b;
+    color: white;
+}
+QPushButton#nodeLibBtn:hover {
+    background: #404040;
+}
+QPushButton#nodeLibBtn:pressed {
+    background: #0078d4;
+}
+"""
+
+def _no_preview():
+    """Fuente de vista previa cuando el grafo no tiene nada que mostrar"""
+    return None
+
+def _geometry_getter(node):
+    """Función sin argumentos que lee la geometría de un nodo productor"""
+    if hasattr(node, 'generate_geometry'):
+        return node.generate_geometry
+    # Leer del cache del nodo: solo recalcula si está dirty
+    return partial(node.get_output_value, 'geometry')
+
+class _GraphRunSignals(QObject):
+    """Señales de _GraphRun; finished lleva la excepción (o None) y los datos de vista previa"""
+    finished = pyqtSignal(object, object)
+
+class _GraphRun(QRunnable):
+    """Ejecuta un NodeGraph fuera del hilo de la GUI y recoge la vista previa"""
+    
+    def __init__(self, node_graph, fetch_preview):
+        super().__init__()
+        self.node_graph = node_graph
+        self.fetch_preview = fetch_preview
+        self.signals = _GraphRunSignals()
+    
+    def run(self):
+        try:
+            self.node_graph.execute_parallel()
+            geometry_data = self.fetch_preview()
+        except Exception as e:
+            self.signals.finished.emit(e, None)
+        else:
+            self.signals.finished.emit(None, geometry_data)
 
 class GoboFlowMainWindow(QMainWindow):
     """
@@ -108,6 +262,9 @@ class GoboFlowMainWindow(QMainWindow):
     # Señales
     project_changed = pyqtSignal()
     
+    # El tema se aplica a la QApplication, compartido por todas las ventanas
+    _theme_applied = False
+    
     def __init__(self):
         super().__init__()
         
@@ -119,9 +276,36 @@ class GoboFlowMainWindow(QMainWindow):
         self.node_editor = None
         self.viewport_widget = None
         self.properties_panel = None
+        self.selected_node_info = None  # Solo existe con el panel de propiedades básico
+        self._viewport_update_preview = None  # Métodos opcionales de los paneles,
+        self._properties_set_node = None      # resueltos en _probe_panels
+        self._last_info_text = None  # Último texto mostrado en selected_node_info
+        self._last_title = ""  # Último título aplicado a la ventana
+        self._node_count = 0  # Nodos en la escena, llevado por eventos
+        self._shown_node_count = 0  # Valor mostrado en node_count_label
+        self._node_actions = self._build_node_actions()
+        self._nodes_by_type = defaultdict(dict)  # NODE_TYPE -> {node_id: nodo}
+        self._invalidate_topology_cache()
+        self._example_loaded = False  # El ejemplo se crea al mostrar la ventana
+        self._graph_running = False  # Hay una ejecución del grafo en segundo plano
+        self._graph_pending = False  # Se pidió otra ejecución mientras tanto
+        
+        # Refresco del viewport por eventos y agrupado: varios cambios seguidos
+        # producen una sola actualización al terminar
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(50)
+        self._viewport_timer.timeout.connect(self.update_viewport)
+        
+        # Ejecución automática tras cambios de parámetros, agrupada: arrastrar
+        # un slider reinicia el timer y el grafo se ejecuta una vez al soltar
+        self._auto_exec_timer = QTimer(self)
+        self._auto_exec_timer.setSingleShot(True)
+        self._auto_exec_timer.setInterval(100)
+        self._auto_exec_timer.timeout.connect(self.auto_execute_and_update)
 
         # Configurar ventana
-        self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
+        self.update_window_title()
         self.setMinimumSize(1000, 700)
         self.resize(1400, 900)
         
@@ -131,19 +315,12 @@ class GoboFlowMainWindow(QMainWindow):
         self.init_toolbars()
         self.init_status_bar()
         self.connect_signals()
+        self._rebuild_indices()
         
-        # Aplicar tema dark
-        self.apply_dark_theme()     
+        # Aplicar tema dark desde el bucle de eventos, tras el primer pintado
+        QTimer.singleShot(0, self.apply_dark_theme)
 
-        # Timer para auto-refresh del viewport
-        self.viewport_refresh_timer = QTimer()
-        self.viewport_refresh_timer.timeout.connect(self.update_viewport)
-        self.viewport_refresh_timer.start(1000)  # Actualizar cada segundo
-        
-         # Crear proyecto de ejemplo
-        QTimer.singleShot(500, self.create_example_project)
-
-        print("🎨 Ventana principal completa de GoboFlow inicializada")
+        log.debug("Ventana principal de GoboFlow inicializada")
     
     def init_ui(self):
         """Inicializa la interfaz principal"""
@@ -176,6 +353,13 @@ class GoboFlowMainWindow(QMainWindow):
         
         # Configurar tamaños
         main_splitter.setSizes([250, 800, 300])
+        
+        self._probe_panels()
+    
+    def _probe_panels(self):
+        """Resuelve una sola vez los métodos opcionales de los paneles"""
+        self._viewport_update_preview = getattr(self.viewport_widget, 'update_preview', None)
+        self._properties_set_node = getattr(self.properties_panel, 'set_node', None)
     
     def create_node_library(self) -> QWidget:
         """Crea la biblioteca de nodos"""
@@ -186,63 +370,20 @@ class GoboFlowMainWindow(QMainWindow):
         
         # Título
         title = QLabel("📚 Biblioteca de Nodos")
-        title.setStyleSheet("font-weight: bold; font-size: 14px; padding: 10px; background: #404040;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
         
-        # Categorías de nodos
-        categories = [
-            ("🎯 Primitivas", [
-                ("Círculo", self.add_circle_node),
-                ("Rectángulo", self.add_rectangle_node),
-                ("Polígono", self.add_polygon_node)
-            ]),
-            ("📊 Parámetros", [
-                ("Número", self.add_number_node),
-                ("Vector", self.add_vector_node),
-                ("Color", self.add_color_node)
-            ]),
-            ("🔧 Modificadores", [
-                ("Transformar", self.add_transform_node),
-                ("Array", self.add_array_node),
-                ("Escalar", self.add_scale_node)
-            ]),
-            ("🔀 Operaciones", [
-                ("Unir", self.add_merge_node),
-                ("Dividir", self.add_split_node),
-                ("Booleanas", self.add_boolean_node)
-            ]),
-            ("📤 Salidas", [
-                ("Visor", self.add_viewer_node),
-                ("Exportar", self.add_export_node)
-            ])
-        ]
-        
-        for category_name, nodes in categories:
-            # Título de categoría
+        for category_name, nodes in _NODE_CATEGORIES:
+            # Título de categoría (estilo en _DARK_QSS: QLabel#catLabel)
             cat_label = QLabel(category_name)
-            cat_label.setStyleSheet("font-weight: bold; color: #00aaff; margin-top: 10px;")
+            cat_label.setObjectName("catLabel")
             layout.addWidget(cat_label)
             
-            # Botones de nodos
-            for node_name, callback in nodes:
+            # Botones de nodos (estilo en _DARK_QSS: QPushButton#nodeLibBtn)
+            for node_name in nodes:
                 btn = QPushButton(f"  {node_name}")
-                btn.setStyleSheet("""
-                    QPushButton {
-                        text-align: left;
-                        padding: 8px;
-                        margin: 1px;
-                        border: 1px solid #555;
-                        background: #2b2b2b;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background: #404040;
-                    }
-                    QPushButton:pressed {
-                        background: #0078d4;
-                    }
-                """)
-                btn.clicked.connect(callback)
+                btn.setObjectName("nodeLibBtn")
+                btn.clicked.connect(self._node_actions[node_name])
                 layout.addWidget(btn)
         
         layout.addStretch()
@@ -259,8 +400,9 @@ class GoboFlowMainWindow(QMainWindow):
         layout.addWidget(center_splitter)
         
         # Editor de nodos
-        if NODE_EDITOR_AVAILABLE:
-            self.node_editor = create_node_editor()
+        node_editor_module = _lazy("ui.node_editor")
+        if node_editor_module is not None and node_editor_module.NODE_EDITOR_AVAILABLE:
+            self.node_editor = node_editor_module.create_node_editor()
             center_splitter.addWidget(self.node_editor)
         else:
             # Placeholder si no está disponible
@@ -269,20 +411,13 @@ class GoboFlowMainWindow(QMainWindow):
             placeholder.setStyleSheet("color: #888; font-size: 16px; background: #2b2b2b;")
             center_splitter.addWidget(placeholder)
         
-        # Viewport con vista previa SVG
-        if VIEWPORT_AVAILABLE:
-            print("🖼️ Creando viewport con SVG...")
-            self.viewport_widget = create_viewport_widget()
-            center_splitter.addWidget(self.viewport_widget)
-            
-            # Conectar señales del viewport si están disponibles
-            if hasattr(self.viewport_widget, 'export_requested'):
-                self.viewport_widget.export_requested.connect(self.on_viewport_export_requested)
-        else:
-            print("📱 Creando viewport placeholder...")
-            # Viewport placeholder
-            self.viewport_widget = create_viewport_widget()
-            center_splitter.addWidget(self.viewport_widget)
+        # Viewport con vista previa SVG (o placeholder si no está disponible)
+        self.viewport_widget = create_viewport_widget()
+        center_splitter.addWidget(self.viewport_widget)
+        
+        # Conectar señales del viewport si están disponibles
+        if hasattr(self.viewport_widget, 'export_requested'):
+            self.viewport_widget.export_requested.connect(self.on_viewport_export_requested)
         
         # Configurar tamaños: más espacio para el editor
         center_splitter.setSizes([400, 300])
@@ -300,7 +435,7 @@ class GoboFlowMainWindow(QMainWindow):
         
         # Título
         title = QLabel("👁️ Vista Previa")
-        title.setStyleSheet("font-weight: bold; padding: 8px; background: #404040; color: white;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
         
         # Área de preview
@@ -313,10 +448,11 @@ class GoboFlowMainWindow(QMainWindow):
     
     def create_properties_panel(self) -> QWidget:
         """Crea el panel de propiedades"""
-        if PROPERTIES_AVAILABLE:
-            print("🎛️ Creando panel de propiedades interactivo...")
+        properties_module = _lazy("ui.properties_panel")
+        if properties_module is not None:
+            log.debug("Creando panel de propiedades interactivo")
             # Panel de propiedades completo e interactivo
-            self.properties_panel = create_props_panel()
+            self.properties_panel = properties_module.create_properties_panel()
             
             # Conectar señales si están disponibles
             if hasattr(self.properties_panel, 'parameter_changed'):
@@ -324,7 +460,7 @@ class GoboFlowMainWindow(QMainWindow):
             
             return self.properties_panel
         else:
-            print("📋 Creando panel de propiedades básico...")
+            log.debug("Creando panel de propiedades básico")
             # Panel básico (versión simplificada)
             panel = QFrame()
             panel.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -333,7 +469,7 @@ class GoboFlowMainWindow(QMainWindow):
             
             # Título
             title = QLabel("⚙️ Propiedades")
-            title.setStyleSheet("font-weight: bold; font-size: 14px; padding: 10px; background: #404040;")
+            title.setObjectName("panelTitle")
             layout.addWidget(title)
             
             # Información del nodo seleccionado
@@ -344,7 +480,8 @@ class GoboFlowMainWindow(QMainWindow):
             
             # Propiedades editables (placeholder)
             props_title = QLabel("🔧 Parámetros:")
-            props_title.setStyleSheet("font-weight: bold; margin-top: 20px; color: #00aaff;")
+            props_title.setObjectName("sectionTitle")
+            layout.addSpacing(20)
             layout.addWidget(props_title)
             
             self.properties_area = QLabel("No hay parámetros editables")
@@ -355,7 +492,7 @@ class GoboFlowMainWindow(QMainWindow):
             
             # Información del proyecto
             project_title = QLabel("📁 Proyecto:")
-            project_title.setStyleSheet("font-weight: bold; color: #00aaff;")
+            project_title.setObjectName("sectionTitle")
             layout.addWidget(project_title)
             
             self.project_info = QLabel("Proyecto nuevo")
@@ -367,6 +504,8 @@ class GoboFlowMainWindow(QMainWindow):
     
     def init_menus(self):
         """Inicializa el menú"""
+        from PyQt6.QtGui import QAction, QKeySequence
+        
         menubar = self.menuBar()
         
         # Menú Archivo
@@ -442,7 +581,7 @@ class GoboFlowMainWindow(QMainWindow):
     
     def init_status_bar(self):
         """Inicializa la barra de estado"""
-        status = self.statusBar()
+        status = self._status = self.statusBar()
         status.showMessage("Listo - Editor de nodos cargado")
         
         # Indicadores permanentes
@@ -452,69 +591,16 @@ class GoboFlowMainWindow(QMainWindow):
         self.zoom_label = QLabel("Zoom: 100%")
         status.addPermanentWidget(self.zoom_label)
     
-    def connect_signals(self):
-        """Conecta las señales"""
-        if self.node_editor:
-            self.node_editor.node_selected.connect(self.on_node_selected)
-            self.node_editor.node_added.connect(self.on_node_added)
-            self.node_editor.node_removed.connect(self.on_node_removed)
-            self.node_editor.connection_created.connect(self.on_connection_created)
-    
     def apply_dark_theme(self):
-        """Aplica el tema oscuro"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QFrame {
-                background-color: #353535;
-                border: 1px solid #555;
-            }
-            QMenuBar {
-                background-color: #404040;
-                border-bottom: 1px solid #555;
-            }
-            QMenuBar::item:selected {
-                background-color: #0078d4;
-            }
-            QMenu {
-                background-color: #404040;
-                border: 1px solid #555;
-            }
-            QMenu::item:selected {
-                background-color: #0078d4;
-            }
-            QToolBar {
-                background-color: #404040;
-                border: 1px solid #555;
-                spacing: 3px;
-            }
-            QStatusBar {
-                background-color: #404040;
-                border-top: 1px solid #555;
-            }
-            QPushButton {
-                background: #505050;
-                border: 1px solid #606060;
-                border-radius: 3px;
-                padding: 5px 10px;
-                color: white;
-            }
-            QPushButton:hover {
-                background: #606060;
-            }
-            QPushButton:pressed {
-                background: #0078d4;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+        """
+        Aplica el tema oscuro a nivel de aplicación: la hoja se parsea una
+        sola vez aunque se creen varias ventanas
+        """
+        if GoboFlowMainWindow._theme_applied:
+            return
+        
+        QApplication.instance().setStyleSheet(_DARK_QSS)
+        GoboFlowMainWindow._theme_applied = True
     
     def create_example_project(self):
         """Crea un proyecto de ejemplo"""
@@ -522,38 +608,47 @@ class GoboFlowMainWindow(QMainWindow):
             return
         
         try:
-            # Limpiar editor
-            self.node_editor.clear_scene()
-            
-            # Añadir nodos de ejemplo
-            self.add_number_node()
-            self.add_circle_node()
-            self.add_viewer_node()
+            # Construir el ejemplo sin señales de escena: los contadores, el
+            # título y el viewport se actualizan una sola vez al final
+            with QSignalBlocker(self.node_editor.scene):
+                # Limpiar editor
+                self.node_editor.clear_scene()
+                
+                # Añadir nodos de ejemplo
+                self.add_number_node()
+                self.add_circle_node()
+                self.add_viewer_node()
+                
+                # Posicionar nodos automáticamente
+                self.arrange_nodes_automatically()
             
-            # Posicionar nodos automáticamente
-            self.arrange_nodes_automatically()
+            self.node_editor.update_info_labels()
+            self.update_node_count()
+            self._rebuild_indices()
+            self.is_modified = True
+            self.update_window_title()
             
-            # Ejecutar automáticamente para mostrar vista previa
-            QTimer.singleShot(1000, self.auto_execute_and_update)
+            # Ejecutar en segundo plano para mostrar vista previa
+            self.auto_execute_and_update()
             
-            self.statusBar().showMessage("Proyecto de ejemplo creado")
-            print("📋 Proyecto de ejemplo creado con 3 nodos")
+            self._status.showMessage("Proyecto de ejemplo creado")
+            log.debug("Proyecto de ejemplo creado con 3 nodos")
             
         except Exception as e:
-            print(f"Error creando proyecto de ejemplo: {e}")
+            log.error("Error creando proyecto de ejemplo: %s", e)
     
     def arrange_nodes_automatically(self):
         """Organiza los nodos automáticamente"""
         if not self.node_editor or not hasattr(self.node_editor, 'scene'):
             return
         
-        # Obtener nodos y organizarlos en columnas
-        nodes = list(self.node_editor.scene.node_graphics.values())
-        
-        for i, node_graphics in enumerate(nodes):
-            x = -200 + (i * 250)  # Espaciado horizontal
-            y = 0
-            node_graphics.setPos(x, y)
+        # Organizar los nodos en columnas sin emitir señales de escena por
+        # cada nodo; se repinta una sola vez al final
+        scene = self.node_editor.scene
+        with QSignalBlocker(scene):
+            for i, node_graphics in enumerate(scene.node_graphics.values()):
+                node_graphics.setPos(-200 + i * 250, 0)  # Espaciado horizontal
+        scene.update()
     
     # ===========================================
     # ACCIONES DE MENÚ Y TOOLBAR
@@ -564,11 +659,13 @@ class GoboFlowMainWindow(QMainWindow):
         if self.check_save_changes():
             if self.node_editor:
                 self.node_editor.clear_scene()
+                self.update_node_count()  # clear_scene no emite node_removed
+                self._rebuild_indices()
             
             self.current_project_path = None
             self.is_modified = False
             self.update_window_title()
-            self.statusBar().showMessage("Nuevo proyecto creado")
+            self._status.showMessage("Nuevo proyecto creado")
     
     def open_project(self):
         """Abre un proyecto"""
@@ -583,7 +680,7 @@ class GoboFlowMainWindow(QMainWindow):
                 # TODO: Implementar carga real de proyecto
                 self.current_project_path = Path(file_path)
                 self.update_window_title()
-                self.statusBar().showMessage(f"Proyecto abierto: {Path(file_path).name}")
+                self._status.showMessage(f"Proyecto abierto: {Path(file_path).name}")
     
     def save_project(self):
         """Guarda el proyecto"""
@@ -591,7 +688,7 @@ class GoboFlowMainWindow(QMainWindow):
             # TODO: Implementar guardado real
             self.is_modified = False
             self.update_window_title()
-            self.statusBar().showMessage("Proyecto guardado")
+            self._status.showMessage("Proyecto guardado")
         else:
             self.save_project_as()
     
@@ -617,31 +714,12 @@ class GoboFlowMainWindow(QMainWindow):
         
         if file_path:
             # TODO: Implementar exportación real desde viewport
-            # Por ahora, crear SVG básico
-            svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" 
-     width="1024" height="1024" 
-     viewBox="0 0 1024 1024"
-     style="background: black;">
-  
-  <!-- Gobo generado por GoboFlow -->
-  <circle cx="512" cy="512" r="200" fill="white" opacity="0.8"/>
-  
-  <text x="50" y="980" fill="white" font-family="Arial" font-size="24">
-    GoboFlow - Editor Visual
-  </text>
-  
-</svg>'''
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            
-            self.statusBar().showMessage(f"SVG exportado: {Path(file_path).name}")
+            # Por ahora, escribir el SVG básico (ya codificado en UTF-8)
+            with Path(file_path).open('wb', buffering=1 << 16) as f:
+                f.write(_SVG_TEMPLATE)
             
-            QMessageBox.information(
-                self, "Exportación Completada",
-                f"Gobo exportado exitosamente a:\n{file_path}"
-            )
+            # Mensaje en la barra de estado en lugar de un diálogo modal
+            self._status.showMessage(f"SVG exportado: {file_path}", 5000)
     
     def execute_graph(self):
         """Ejecuta el grafo de nodos con actualización automática del viewport"""
@@ -650,15 +728,17 @@ class GoboFlowMainWindow(QMainWindow):
             self.node_editor.execute_graph()
             
             # Actualizar viewport automáticamente
-            QTimer.singleShot(200, self.update_viewport)
+            self._schedule_viewport()
             
-            self.statusBar().showMessage("Grafo ejecutado - Vista previa actualizada")
+            self._status.showMessage("Grafo ejecutado - Vista previa actualizada")
     
     def clear_graph(self):
         """Limpia el grafo"""
         if self.node_editor:
             self.node_editor.clear_scene()
-            self.statusBar().showMessage("Grafo limpiado")
+            self.update_node_count()  # clear_scene no emite node_removed
+            self._rebuild_indices()
+            self._status.showMessage("Grafo limpiado")
     
     def fit_view(self):
         """Ajusta la vista"""
@@ -679,103 +759,82 @@ class GoboFlowMainWindow(QMainWindow):
         if self.node_editor:
             self.node_editor.add_circle_node()
     
-    def add_rectangle_node(self):
-        """Añade un nodo rectángulo"""
-        self.statusBar().showMessage("Rectángulo - Próximamente")
-    
-    def add_polygon_node(self):
-        """Añade un nodo polígono"""
-        self.statusBar().showMessage("Polígono - Próximamente")
-    
     def add_number_node(self):
         """Añade un nodo número"""
         if self.node_editor:
             self.node_editor.add_number_node()
     
-    def add_vector_node(self):
-        """Añade un nodo vector"""
-        self.statusBar().showMessage("Vector - Próximamente")
-    
-    def add_color_node(self):
-        """Añade un nodo color"""
-        self.statusBar().showMessage("Color - Próximamente")
-    
-    def add_transform_node(self):
-        """Añade un nodo transformar"""
-        self.statusBar().showMessage("Transformar - Próximamente")
-    
-    def add_array_node(self):
-        """Añade un nodo array"""
-        self.statusBar().showMessage("Array - Próximamente")
-    
-    def add_scale_node(self):
-        """Añade un nodo escalar"""
-        self.statusBar().showMessage("Escalar - Próximamente")
-    
-    def add_merge_node(self):
-        """Añade un nodo unir"""
-        self.statusBar().showMessage("Unir - Próximamente")
-    
-    def add_split_node(self):
-        """Añade un nodo dividir"""
-        self.statusBar().showMessage("Dividir - Próximamente")
-    
-    def add_boolean_node(self):
-        """Añade un nodo booleanas"""
-        self.statusBar().showMessage("Booleanas - Próximamente")
-    
     def add_viewer_node(self):
         """Añade un nodo visor"""
         if self.node_editor:
             self.node_editor.add_viewer_node()
     
-    def add_export_node(self):
-        """Añade un nodo exportar"""
-        self.statusBar().showMessage("Exportar - Próximamente")
+    def _coming_soon(self, node_name: str, *_args):
+        """Tipos de nodo aún no disponibles en la biblioteca"""
+        self._status.showMessage(_SOON[node_name])
+    
+    def _build_node_actions(self) -> dict:
+        """Acción de cada botón de la biblioteca, por nombre de nodo"""
+        actions = {
+            "Círculo": self.add_circle_node,
+            "Número": self.add_number_node,
+            "Visor": self.add_viewer_node,
+        }
+        for _, nodes in _NODE_CATEGORIES:
+            for node_name in nodes:
+                if node_name not in actions:
+                    actions[node_name] = partial(self._coming_soon, node_name)
+        return actions
     
     # ===========================================
     # EVENTOS Y SEÑALES
     # ===========================================
     
-    def on_node_selected(self, node):
-        """Maneja selección de nodo"""
-        if node:
-            info = f"📋 {node.title}\n"
-            info += f"Tipo: {node.NODE_TYPE}\n"
-            info += f"Categoría: {getattr(node, 'NODE_CATEGORY', 'N/A')}\n"
-            info += f"ID: {node.id[:8]}..."
-            
-            self.selected_node_info.setText(info)
-            
-            # TODO: Mostrar parámetros editables
-            self.properties_area.setText("Parámetros editables\n(Próximamente)")
-        else:
-            self.selected_node_info.setText("Selecciona un nodo para ver sus propiedades")
-            self.properties_area.setText("No hay parámetros editables")
-    
+    @pyqtSlot(object)
     def on_node_added(self, node):
         """Maneja nodo añadido"""
-        self.update_node_count()
+        self._node_count += 1
+        self._push_node_count()
+        self._nodes_by_type[node.NODE_TYPE][node.id] = node
+        self._invalidate_topology_cache()
         self.is_modified = True
         self.update_window_title()
+        self._schedule_viewport()
     
+    @pyqtSlot(object)
     def on_node_removed(self, node):
         """Maneja nodo eliminado"""
-        self.update_node_count()
+        self._node_count -= 1
+        self._push_node_count()
+        self._nodes_by_type[node.NODE_TYPE].pop(node.id, None)
+        self._invalidate_topology_cache()
         self.is_modified = True
         self.update_window_title()
+        self._schedule_viewport()
     
+    @pyqtSlot(object)
     def on_connection_created(self, connection):
         """Maneja conexión creada"""
         self.is_modified = True
         self.update_window_title()
-        self.statusBar().showMessage("Conexión creada")
+        self._status.showMessage("Conexión creada")
+        self._schedule_viewport()
+    
+    def _schedule_viewport(self, *_args):
+        """Programa un refresco del viewport (se agrupan las peticiones seguidas)"""
+        self._viewport_timer.start()
     
     def update_node_count(self):
-        """Actualiza el contador de nodos"""
+        """Resincroniza el contador de nodos con la escena"""
         if self.node_editor and hasattr(self.node_editor, 'scene'):
-            count = len(self.node_editor.scene.node_graphics)
-            self.node_count_label.setText(f"Nodos: {count}")
+            self._node_count = len(self.node_editor.scene.node_graphics)
+            self._push_node_count()
+    
+    def _push_node_count(self):
+        """Muestra el contador de nodos solo si cambió"""
+        if self._shown_node_count != self._node_count:
+            self.node_count_label.setText(f"Nodos: {self._node_count}")
+            self._shown_node_count = self._node_count
     
     def update_window_title(self):
         """Actualiza el título de la ventana"""
@@ -787,7 +846,11 @@ class GoboFlowMainWindow(QMainWindow):
         if self.is_modified:
             title += " *"
         
+        # Evitar llamadas al gestor de ventanas si el título no cambió
+        if title == self._last_title:
+            return
         self.setWindowTitle(title)
+        self._last_title = title
     
     def check_save_changes(self) -> bool:
         """Verifica si hay cambios sin guardar"""
@@ -810,39 +873,20 @@ class GoboFlowMainWindow(QMainWindow):
     
     def show_about(self):
         """Muestra diálogo acerca de"""
-        QMessageBox.about(self, "Acerca de GoboFlow", f"""
-        <h3>{APP_NAME} v{APP_VERSION}</h3>
-        <p><b>Generador procedural de gobos para iluminación teatral</b></p>
-        
-        <p><b>Características:</b></p>
-        <ul>
-        <li>✅ Editor visual de nodos</li>
-        <li>✅ Sistema de conexiones drag & drop</li>
-        <li>✅ Generación procedural de geometrías</li>
-        <li>✅ Exportación SVG de alta calidad</li>
-        <li>🔄 Viewport en tiempo real (próximamente)</li>
-        <li>🔄 Más tipos de nodos (próximamente)</li>
-        </ul>
-        
-        <p><b>Controles del Editor:</b></p>
-        <ul>
-        <li>• Arrastra nodos para moverlos</li>
-        <li>• Haz clic en sockets (círculos) para conectar</li>
-        <li>• Ctrl + Rueda del mouse para zoom</li>
-        <li>• Botón medio para pan</li>
-        <li>• Delete para eliminar seleccionados</li>
-        <li>• Escape para cancelar conexiones</li>
-        </ul>
-        
-        <p>Desarrollado con Python y PyQt6</p>
-        <p><a href="https://github.com/eliasdiaz3d/GoboFlow">GitHub</a></p>
-        """)
+        QMessageBox.about(self, "Acerca de GoboFlow", _ABOUT_HTML)
+    
+    def showEvent(self, event):
+        """Crea el proyecto de ejemplo la primera vez que se muestra la ventana"""
+        super().showEvent(event)
+        if not self._example_loaded:
+            self._example_loaded = True
+            QTimer.singleShot(0, self.create_example_project)
     
     def closeEvent(self, event):
         """Maneja el cierre de la ventana"""
         if self.check_save_changes():
             event.accept()
-            print("👋 Cerrando GoboFlow...")
+            log.debug("Cerrando GoboFlow")
         else:
             event.ignore()
 
@@ -854,121 +898,182 @@ class GoboFlowMainWindow(QMainWindow):
             self.node_editor.node_removed.connect(self.on_node_removed)
             self.node_editor.connection_created.connect(self.on_connection_created)
             
-            # Conectar cambios en el grafo con el viewport
-            self.node_editor.node_added.connect(self.update_viewport)
-            self.node_editor.node_removed.connect(self.update_viewport)
-            self.node_editor.connection_created.connect(self.update_viewport)
+            # Quitar una conexión también cambia la vista previa
+            if hasattr(self.node_editor, 'connection_removed'):
+                self.node_editor.connection_removed.connect(self._schedule_viewport)
+            
+            # Cambios hechos con los controles integrados en los nodos
+            if hasattr(self.node_editor, 'parameter_changed'):
+                self.node_editor.parameter_changed.connect(self.on_parameter_changed)
 
+    @pyqtSlot(object)
     def on_node_selected(self, node):
         """Maneja selección de nodo"""
-        if node:
-            # Actualizar panel de propiedades
-            if hasattr(self, 'properties_panel') and hasattr(self.properties_panel, 'set_node'):
-                self.properties_panel.set_node(node)
-            
-            # Actualizar información básica si no hay panel completo
-            if hasattr(self, 'selected_node_info'):
-                info = f"📋 {node.title}\n"
-                info += f"Tipo: {node.NODE_TYPE}\n"
-                info += f"Categoría: {getattr(node, 'NODE_CATEGORY', 'N/A')}\n"
-                info += f"ID: {node.id[:8]}..."
-                self.selected_node_info.setText(info)
-        else:
-            # Ningún nodo seleccionado
-            if hasattr(self, 'properties_panel') and hasattr(self.properties_panel, 'set_node'):
-                self.properties_panel.set_node(None)
-            
-            if hasattr(self, 'selected_node_info'):
-                self.selected_node_info.setText("Selecciona un nodo para ver sus propiedades")
+        # Actualizar panel de propiedades (None si no hay nodo seleccionado)
+        if self._properties_set_node is not None:
+            self._properties_set_node(node)
+        
+        # Actualizar información básica si no hay panel completo
+        if self.selected_node_info is not None:
+            if node:
+                self._set_node_info(_node_info_text(
+                    node.title, node.NODE_TYPE, getattr(node, 'NODE_CATEGORY', 'N/A'), node.id
+                ))
+            else:
+                self._set_node_info("Selecciona un nodo para ver sus propiedades")
+    
+    def _set_node_info(self, text: str):
+        """Actualiza la etiqueta de información solo si el texto cambió"""
+        if text != self._last_info_text:
+            self.selected_node_info.setText(text)
+            self._last_info_text = text
 
+    @pyqtSlot(object, str, object)
     def on_parameter_changed(self, node, param_name, new_value):
-        """Maneja cambios en parámetros desde el panel de propiedades"""
-        print(f"🎛️ Parámetro cambió: {node.title}.{param_name} = {new_value}")
+        """Maneja cambios en parámetros (panel de propiedades o controles del nodo)"""
+        log.debug("Parámetro cambió: %s.%s = %s", node.title, param_name, new_value)
         
         # Ejecutar el grafo automáticamente después de cambio de parámetro
-        QTimer.singleShot(100, self.auto_execute_and_update)
+        # (start() reinicia el timer si ya estaba en marcha)
+        self._auto_exec_timer.start()
         
         # Mostrar en status bar
-        self.statusBar().showMessage(f"Actualizado: {param_name} = {new_value}")
+        self._status.showMessage(f"Actualizado: {param_name} = {new_value}")
 
+    @pyqtSlot()
     def auto_execute_and_update(self):
-        """Ejecuta el grafo automáticamente y actualiza el viewport"""
-        try:
-            if self.node_editor and hasattr(self.node_editor, 'scene'):
-                # Ejecutar grafo
-                self.node_editor.scene.execute_graph()
-                
-                # Actualizar viewport
-                self.update_viewport()
-                
-        except Exception as e:
-            print(f"❌ Error en auto-ejecución: {e}")
+        """
+        Ejecuta el grafo en un hilo del pool y actualiza el viewport al
+        terminar. Si ya hay una ejecución en curso, se repite una vez al acabar.
+        """
+        if not self.node_editor or not hasattr(self.node_editor, 'scene'):
+            return
+        
+        if self._graph_running:
+            self._graph_pending = True
+            return
+        
+        # La fuente de vista previa se resuelve aquí, en el hilo de la GUI; el
+        # worker solo ejecuta el grafo y lee sus datos
+        self._graph_running = True
+        worker = _GraphRun(self.node_editor.scene.node_graph, self._preview_source())
+        worker.signals.finished.connect(self._on_graph_executed)
+        QThreadPool.globalInstance().start(worker)
+    
+    @pyqtSlot(object, object)
+    def _on_graph_executed(self, error, geometry_data):
+        """Fin de la ejecución en segundo plano (en el hilo de la GUI)"""
+        self._graph_running = False
+        if error is not None:
+            log.error("Error en auto-ejecución: %s", error)
+        
+        # Hubo cambios durante la ejecución: los nodos editados siguen DIRTY
+        # (ver Node._dirty_generation), así que se repite y solo se muestra el
+        # resultado de la nueva ejecución
+        if self._graph_pending:
+            self._graph_pending = False
+            self.auto_execute_and_update()
+            return
+        
+        # Una sola actualización al final de la ejecución: absorbe también la
+        # que estuviera programada por eventos del grafo
+        self._viewport_timer.stop()
+        if error is not None:
+            self.update_viewport()
+        else:
+            self._apply_viewport_data(geometry_data)
 
+    @pyqtSlot()
     def update_viewport(self):
         """Actualiza el viewport con la geometría más reciente"""
         try:
-            if not hasattr(self, 'viewport_widget') or not self.viewport_widget:
-                return
-            
-            if not hasattr(self.viewport_widget, 'update_preview'):
-                return
-            
-            # Buscar nodo viewer en el grafo
+            self._apply_viewport_data(self._preview_source()())
+        except Exception as e:
+            log.error("Error actualizando viewport: %s", e)
+    
+    def _apply_viewport_data(self, geometry_data):
+        """Muestra la geometría en el viewport (solo desde el hilo de la GUI)"""
+        if self._viewport_update_preview is not None:
+            self._viewport_update_preview(geometry_data)
+    
+    def _preview_source(self):
+        """
+        Función sin argumentos que devuelve los datos de vista previa. Se
+        resuelve una vez por topología y no toca widgets, así que sirve desde
+        el worker de ejecución.
+        """
+        if self._preview_source_cache is None:
             viewer_node = self.find_viewer_node()
-            
-            if viewer_node:
-                # Intentar obtener datos del viewer
-                if hasattr(viewer_node, 'get_last_data'):
-                    geometry_data = viewer_node.get_last_data()
-                    self.viewport_widget.update_preview(geometry_data)
-                elif hasattr(viewer_node, 'compute'):
-                    # Ejecutar el nodo viewer para obtener datos
-                    result = viewer_node.compute()
-                    geometry_data = result.get('display_geometry')
-                    self.viewport_widget.update_preview(geometry_data)
+            if viewer_node is None:
+                node = self._find_geometry_node()
+                source = _no_preview if node is None else _geometry_getter(node)
+            elif hasattr(viewer_node, 'get_last_data'):
+                source = viewer_node.get_last_data
             else:
-                # No hay viewer, buscar cualquier geometría en el grafo
-                geometry_data = self.find_any_geometry()
-                self.viewport_widget.update_preview(geometry_data)
-                
-        except Exception as e:
-            print(f"❌ Error actualizando viewport: {e}")
+                # Leer del cache del nodo: solo recalcula si está dirty
+                source = partial(viewer_node.get_output_value, 'display_geometry')
+            self._preview_source_cache = source
+        return self._preview_source_cache
 
+    def _invalidate_topology_cache(self):
+        """Olvida los nodos de vista previa encontrados: cambió la topología"""
+        self._viewer_node_cache = _NOT_SCANNED
+        self._geometry_node_cache = _NOT_SCANNED
+        self._preview_source_cache = None
+    
     def find_viewer_node(self):
-        """Busca el primer nodo viewer en el grafo"""
-        try:
-            if not self.node_editor or not hasattr(self.node_editor, 'scene'):
-                return None
-            
+        """Busca el primer nodo viewer en el grafo (cacheado hasta que cambien los nodos)"""
+        if self._viewer_node_cache is _NOT_SCANNED:
+            self._viewer_node_cache = self._scan_viewer_node()
+        return self._viewer_node_cache
+    
+    def _scan_viewer_node(self):
+        """Primer nodo viewer, según el índice por tipo"""
+        viewers = self._nodes_by_type.get('viewer')
+        return next(iter(viewers.values()), None) if viewers else None
+    
+    def _rebuild_indices(self):
+        """
+        Reconstruye el índice por tipo recorriendo el grafo una vez y resuelve
+        la fuente de vista previa. Para cargas en bloque (ejemplo, limpiar la
+        escena) que no emiten node_added/node_removed por nodo.
+        """
+        self._nodes_by_type.clear()
+        if self.node_editor and hasattr(self.node_editor, 'scene'):
             for node in self.node_editor.scene.node_graph.nodes.values():
-                if hasattr(node, 'NODE_TYPE') and node.NODE_TYPE == 'viewer':
-                    return node
-            
-            return None
-        except:
-            return None
+                self._nodes_by_type[node.NODE_TYPE][node.id] = node
+        self._invalidate_topology_cache()
+        self._preview_source()
 
     def find_any_geometry(self):
         """Busca cualquier geometría generada en el grafo"""
-        try:
-            if not self.node_editor or not hasattr(self.node_editor, 'scene'):
-                return None
-            
-            # Buscar nodos que generen geometría
-            for node in self.node_editor.scene.node_graph.nodes.values():
-                if hasattr(node, 'NODE_TYPE'):
-                    if node.NODE_TYPE in ['circle', 'rectangle', 'polygon']:
-                        if hasattr(node, 'generate_geometry'):
-                            return node.generate_geometry()
-                        elif hasattr(node, 'compute'):
-                            result = node.compute()
-                            if 'geometry' in result:
-                                return result['geometry']
-            
+        node = self._find_geometry_node()
+        if node is None:
             return None
+        
+        try:
+            return _geometry_getter(node)()
         except:
             return None
+    
+    def _find_geometry_node(self):
+        """
+        Primer nodo que genera geometría. Se cachea el nodo productor, no la
+        geometría: esta depende de los parámetros y se pide en cada actualización
+        """
+        if self._geometry_node_cache is _NOT_SCANNED:
+            self._geometry_node_cache = self._scan_geometry_node()
+        return self._geometry_node_cache
+    
+    def _scan_geometry_node(self):
+        """Primer nodo que genera geometría, según el índice por tipo"""
+        for node_type in _GEOMETRY_NODE_TYPES:
+            for node in self._nodes_by_type.get(node_type, {}).values():
+                if hasattr(node, 'generate_geometry') or 'geometry' in node.output_sockets:
+                    return node
+        return None
 
+    @pyqtSlot(str)
     def on_viewport_export_requested(self, format_type):
         """Maneja solicitudes de exportación desde el viewport"""
         if format_type == "svg":
@@ -992,15 +1097,12 @@ class GoboFlowMainWindow(QMainWindow):
             if file_path:
                 svg_content = self.viewport_widget.get_current_svg()
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(svg_content)
-                
-                self.statusBar().showMessage(f"SVG exportado: {Path(file_path).name}")
+                # Una sola escritura binaria con buffer grande (el SVG puede ocupar MB)
+                with Path(file_path).open('wb', buffering=1 << 16) as f:
+                    f.write(svg_content.encode('utf-8'))
                 
-                QMessageBox.information(
-                    self, "Exportación Completada",
-                    f"SVG exportado exitosamente a:\n{file_path}"
-                )
+                # Mensaje en la barra de estado en lugar de un diálogo modal
+                self._status.showMessage(f"SVG exportado: {file_path}", 5000)
                 
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error exportando SVG: {e}")
@@ -1059,177 +1161,3 @@ def run_gui():
 
 if __name__ == "__main__":
     sys.exit(run_gui())
-
-
-def on_node_selected(self, node):
-    """Maneja selección de nodo"""
-    if node:
-        # Actualizar panel de propiedades si está disponible
-        if PROPERTIES_AVAILABLE and hasattr(self, 'properties_panel'):
-            if hasattr(self.properties_panel, 'set_node'):
-                self.properties_panel.set_node(node)
-        
-        # Actualizar información básica
-        if hasattr(self, 'selected_node_info'):
-            info = f"📋 {node.title}\n"
-            info += f"Tipo: {getattr(node, 'NODE_TYPE', 'unknown')}\n"
-            info += f"Categoría: {getattr(node, 'NODE_CATEGORY', 'N/A')}\n"
-            info += f"ID: {node.id[:8]}..."
-            self.selected_node_info.setText(info)
-    else:
-        # Ningún nodo seleccionado
-        if PROPERTIES_AVAILABLE and hasattr(self, 'properties_panel'):
-            if hasattr(self.properties_panel, 'set_node'):
-                self.properties_panel.set_node(None)
-        
-        if hasattr(self, 'selected_node_info'):
-            self.selected_node_info.setText("Selecciona un nodo para ver sus propiedades")
-
-def on_parameter_changed(self, node, param_name, new_value):
-    """Maneja cambios en parámetros desde el panel de propiedades"""
-    print(f"🎛️ Parámetro cambió: {node.title}.{param_name} = {new_value}")
-    
-    # Ejecutar el grafo automáticamente después de cambio de parámetro
-    QTimer.singleShot(100, self.auto_execute_and_update)
-    
-    # Mostrar en status bar
-    self.statusBar().showMessage(f"Actualizado: {param_name} = {new_value}")
-
-def auto_execute_and_update(self):
-    """Ejecuta el grafo automáticamente y actualiza el viewport"""
-    try:
-        if self.node_editor and hasattr(self.node_editor, 'scene'):
-            # Ejecutar grafo
-            self.node_editor.scene.execute_graph()
-            
-            # Actualizar viewport si está disponible
-            if VIEWPORT_AVAILABLE:
-                self.update_viewport()
-            
-    except Exception as e:
-        print(f"❌ Error en auto-ejecución: {e}")
-
-def update_viewport(self):
-    """Actualiza el viewport con la geometría más reciente"""
-    try:
-        if not VIEWPORT_AVAILABLE or not hasattr(self, 'viewport_widget'):
-            return
-        
-        if not hasattr(self.viewport_widget, 'update_preview'):
-            return
-        
-        # Buscar nodo viewer en el grafo
-        viewer_node = self.find_viewer_node()
-        
-        if viewer_node:
-            # Intentar obtener datos del viewer
-            if hasattr(viewer_node, 'get_last_data'):
-                geometry_data = viewer_node.get_last_data()
-                self.viewport_widget.update_preview(geometry_data)
-                print(f"🔄 Viewport actualizado con datos del viewer")
-            elif hasattr(viewer_node, 'compute'):
-                # Ejecutar el nodo viewer para obtener datos
-                result = viewer_node.compute()
-                geometry_data = result.get('display_geometry')
-                self.viewport_widget.update_preview(geometry_data)
-                print(f"🔄 Viewport actualizado ejecutando viewer")
-        else:
-            # No hay viewer, buscar cualquier geometría en el grafo
-            geometry_data = self.find_any_geometry()
-            if geometry_data:
-                self.viewport_widget.update_preview(geometry_data)
-                print(f"🔄 Viewport actualizado con geometría encontrada")
-            
-    except Exception as e:
-        print(f"❌ Error actualizando viewport: {e}")
-
-def find_viewer_node(self):
-    """Busca el primer nodo viewer en el grafo"""
-    try:
-        if not self.node_editor or not hasattr(self.node_editor, 'scene'):
-            return None
-        
-        for node in self.node_editor.scene.node_graph.nodes.values():
-            if hasattr(node, 'NODE_TYPE') and node.NODE_TYPE == 'viewer':
-                return node
-        
-        return None
-    except:
-        return None
-
-def find_any_geometry(self):
-    """Busca cualquier geometría generada en el grafo"""
-    try:
-        if not self.node_editor or not hasattr(self.node_editor, 'scene'):
-            return None
-        
-        # Buscar nodos que generen geometría
-        for node in self.node_editor.scene.node_graph.nodes.values():
-            if hasattr(node, 'NODE_TYPE'):
-                if node.NODE_TYPE in ['circle', 'rectangle', 'polygon']:
-                    if hasattr(node, 'generate_geometry'):
-                        return node.generate_geometry()
-                    elif hasattr(node, 'compute'):
-                        result = node.compute()
-                        if 'geometry' in result:
-                            return result['geometry']
-        
-        return None
-    except:
-        return None
-
-def on_viewport_export_requested(self, format_type):
-    """Maneja solicitudes de exportación desde el viewport"""
-    print(f"📤 Exportación solicitada: {format_type}")
-    if format_type == "svg":
-        self.export_svg_from_viewport()
-    elif format_type == "png":
-        self.export_png_from_viewport()
-
-def export_svg_from_viewport(self):
-    """Exporta SVG desde el viewport"""
-    try:
-        if not VIEWPORT_AVAILABLE or not hasattr(self, 'viewport_widget'):
-            self.export_svg()  # Fallback al método original
-            return
-        
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Exportar SVG desde Viewport",
-            str(Path.home() / "gobo_viewport.svg"),
-            "SVG Files (*.svg);;All Files (*.*)"
-        )
-        
-        if file_path:
-            if hasattr(self.viewport_widget, 'get_current_svg'):
-                svg_content = self.viewport_widget.get_current_svg()
-            else:
-                # Fallback básico
-                svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024" style="background: black;">
-  <circle cx="512" cy="512" r="200" fill="white" opacity="0.8"/>
-  <text x="50" y="980" fill="white" font-family="Arial" font-size="24">GoboFlow - Vista Previa</text>
-</svg>'''
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            
-            self.statusBar().showMessage(f"SVG exportado: {Path(file_path).name}")
-            
-            QMessageBox.information(
-                self, "Exportación Completada",
-                f"SVG exportado exitosamente a:\n{file_path}"
-            )
-            
-    except Exception as e:
-        QMessageBox.warning(self, "Error", f"Error exportando SVG: {e}")
-
-def export_png_from_viewport(self):
-    """Exporta PNG desde el viewport (futuro)"""
-    QMessageBox.information(
-        self, "Próximamente",
-        "La exportación PNG estará disponible en una próxima versión.\n\n"
-        "Por ahora, puedes:\n"
-        "1. Exportar como SVG\n"
-        "2. Abrir el SVG en un navegador\n"
-        "3. Hacer captura de pantalla"
-    )
\ No newline at end of file
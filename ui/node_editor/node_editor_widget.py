@@ -18,6 +18,7 @@ from PyQt6.QtGui import (
 )
 
 from core.node_system import NodeGraph, Node
+from core.node_registry import create_node
 from .node_graphics import NodeGraphicsItem, create_node_graphics, NodeTheme
 from .connection_graphics import ConnectionManager, ConnectionGraphicsItem
 
@@ -32,6 +33,7 @@ class NodeEditorScene(QGraphicsScene):
     node_removed = pyqtSignal(object)   # Node
     connection_created = pyqtSignal(object)  # Connection
     connection_removed = pyqtSignal(object) # Connection
+    parameter_changed = pyqtSignal(object, str, object)  # Node, parámetro, valor
     
     # Constantes de la grilla
     GRID_SIZE = 20
@@ -254,6 +256,7 @@ class NodeEditorScene(QGraphicsScene):
         try:
             # Obtener orden de ejecución
             execution_order = self.node_graph.get_execution_order()
+            deferred = self.node_graph.get_deferred_nodes()
             
             # Resetear estados visuales
             for node_graphics in self.node_graphics.values():
@@ -262,19 +265,24 @@ class NodeEditorScene(QGraphicsScene):
             
             # Ejecutar nodos con visualización
             for node in execution_order:
+                # Las ramas lazy no seleccionadas no se ejecutan
+                if node.id in deferred:
+                    continue
+                
+                # evaluate() toma el lock del nodo: puede coincidir con una
+                # ejecución en segundo plano de la ventana principal
                 node.mark_dirty()
-                if hasattr(node, 'compute'):
-                    result = node.compute()
-                    
-                    # Activar conexiones de salida
-                    for output_socket in node.output_sockets.values():
-                        for connection in output_socket.connections:
-                            connection_graphics = self.connection_manager.connections.get(connection.id)
-                            if connection_graphics:
-                                connection_graphics.set_active(True)
-                                
-                                # Programar desactivación
-                                QTimer.singleShot(1000, lambda cg=connection_graphics: cg.set_active(False))
+                node.evaluate()
+                
+                # Activar conexiones de salida
+                for output_socket in node.output_sockets.values():
+                    for connection in output_socket.connections:
+                        connection_graphics = self.connection_manager.connections.get(connection.id)
+                        if connection_graphics:
+                            connection_graphics.set_active(True)
+                            
+                            # Programar desactivación
+                            QTimer.singleShot(1000, lambda cg=connection_graphics: cg.set_active(False))
             
             print(f"✅ Grafo ejecutado: {len(execution_order)} nodos")
             
@@ -389,6 +397,7 @@ class NodeEditorWidget(QWidget):
     node_removed = pyqtSignal(object)
     connection_created = pyqtSignal(object)
     connection_removed = pyqtSignal(object)
+    parameter_changed = pyqtSignal(object, str, object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -619,6 +628,7 @@ class NodeEditorWidget(QWidget):
         self.scene.node_removed.connect(self.node_removed.emit)
         self.scene.connection_created.connect(self.connection_created.emit)
         self.scene.connection_removed.connect(self.connection_removed.emit)
+        self.scene.parameter_changed.connect(self.parameter_changed.emit)
         
         # Actualización de zoom
         self.view.scene().changed.connect(self.update_zoom_label)
@@ -648,8 +658,7 @@ class NodeEditorWidget(QWidget):
     def add_circle_node(self):
         """Añade un nodo círculo"""
         try:
-            from nodes.primitives.circle_node import CircleNode
-            node = CircleNode("Círculo")
+            node = create_node("circle", "Círculo")
             
             # Posicionar en el centro de la vista
             center = self.view.mapToScene(self.view.rect().center())
@@ -662,8 +671,7 @@ class NodeEditorWidget(QWidget):
     def add_number_node(self):
         """Añade un nodo número"""
         try:
-            from nodes.base.base_node import NumberParameterNode
-            node = NumberParameterNode("Número")
+            node = create_node("number_parameter", "Número")
             
             center = self.view.mapToScene(self.view.rect().center())
             self.scene.add_node(node, center)
@@ -675,8 +683,7 @@ class NodeEditorWidget(QWidget):
     def add_viewer_node(self):
         """Añade un nodo visor"""
         try:
-            from nodes.base.base_node import ViewerNode
-            node = ViewerNode("Visor")
+            node = create_node("viewer", "Visor")
             
             center = self.view.mapToScene(self.view.rect().center())
             self.scene.add_node(node, center)
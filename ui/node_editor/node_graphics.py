@@ -364,6 +364,7 @@ class ParameterNodeGraphics(NodeGraphicsItem):
                 self.node.set_parameter("value", new_value)
                 value_label.setText(f"Valor: {new_value:.2f}")
                 self.node.mark_dirty()
+                self.notify_parameter_changed("value", new_value)
             
             slider.valueChanged.connect(on_slider_change)
             layout.addWidget(slider)
@@ -386,12 +387,19 @@ class ParameterNodeGraphics(NodeGraphicsItem):
                 new_value = [x_spin.value(), y_spin.value()]
                 self.node.set_parameter("value", new_value)
                 self.node.mark_dirty()
+                self.notify_parameter_changed("value", new_value)
             
             x_spin.valueChanged.connect(update_vector)
             y_spin.valueChanged.connect(update_vector)
         
         widget.setMaximumWidth(self.NODE_WIDTH - 2 * self.CONTENT_MARGIN)
         return widget
+    
+    def notify_parameter_changed(self, param_name: str, new_value):
+        """Avisa a la escena de un cambio hecho desde los controles del nodo"""
+        scene = self.scene()
+        if scene is not None and hasattr(scene, 'parameter_changed'):
+            scene.parameter_changed.emit(self.node, param_name, new_value)
 
 class ViewerNodeGraphics(NodeGraphicsItem):
     """
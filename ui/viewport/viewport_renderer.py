@@ -32,20 +32,20 @@ except ImportError:
 
 from config import RENDER_SETTINGS, RenderQuality, DARK_THEME
 from core.node_system import NodeGraph, Node
-from nodes.primitives.circle_node import CircleGeometry
+from utils.geometry.base_geometry import Circle
 from nodes.primitives.rectangle_node import RectangleGeometry
 
 class GeometryRenderer:
     """Renderizador de geometrías individuales"""
     
     @staticmethod
-    def render_circle(painter: QPainter, circle: CircleGeometry, render_mode: str = "preview"):
+    def render_circle(painter: QPainter, circle: Circle, render_mode: str = "preview"):
         """Renderiza un círculo"""
-        cx, cy = circle.center
+        cx, cy = circle.circle_center
         radius = circle.radius
         
         # Configurar pen y brush
-        if circle.filled:
+        if getattr(circle, 'filled', True):
             painter.setBrush(QBrush(QColor(255, 255, 255)))
             painter.setPen(QPen(QColor(255, 255, 255), 1))
         else:
@@ -93,7 +93,7 @@ class GeometryRenderer:
     @staticmethod
     def render_geometry(painter: QPainter, geometry: Any, render_mode: str = "preview"):
         """Renderiza cualquier tipo de geometría"""
-        if isinstance(geometry, CircleGeometry):
+        if isinstance(geometry, Circle):
             GeometryRenderer.render_circle(painter, geometry, render_mode)
         elif isinstance(geometry, RectangleGeometry):
             GeometryRenderer.render_rectangle(painter, geometry, render_mode)
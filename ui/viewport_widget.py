@@ -454,6 +454,9 @@ class CanvasWidget(QWidget):
         self.zoom_factor = 1.0
         
         self.setStyleSheet("background: black; border: 2px solid #666; border-radius: 4px;")
+        
+        # paintEvent rellena todo el rect: Qt no necesita borrar el fondo antes
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
     
     def set_geometry(self, geometry_data):
         self.geometry_data = geometry_data
@@ -4,7 +4,9 @@ Define las clases fundamentales para manejar geometrías 2D
 """
 
 import math
-from typing import List, Tuple, Optional, Any, Dict
+from array import array
+from functools import lru_cache
+from typing import List, Tuple, Optional, Any, Dict, Sequence
 from abc import ABC, abstractmethod
 
 class Geometry(ABC):
@@ -98,30 +100,20 @@ class Geometry(ABC):
         # Crear copia de la geometría
         transformed = self.copy()
         
-        # Aplicar transformaciones a los vértices
-        new_vertices = []
-        for x, y in transformed.vertices:
-            # Trasladar al origen
-            x -= origin[0]
-            y -= origin[1]
-            
-            # Escalar
-            x *= scale[0]
-            y *= scale[1]
-            
-            # Rotar
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                new_x = x * cos_r - y * sin_r
-                new_y = x * sin_r + y * cos_r
-                x, y = new_x, new_y
-            
-            # Trasladar de vuelta y aplicar traslación
-            x += origin[0] + translation[0]
-            y += origin[1] + translation[1]
-            
-            new_vertices.append((x, y))
+        # Combinar escala, rotación y traslación en una única matriz afín
+        # (el seno y coseno se calculan una sola vez, no por vértice)
+        ox, oy = origin
+        cos_r = math.cos(rotation)
+        sin_r = math.sin(rotation)
+        a = scale[0] * cos_r
+        b = -scale[1] * sin_r
+        c = scale[0] * sin_r
+        d = scale[1] * cos_r
+        e = ox + translation[0] - a * ox - b * oy
+        f = oy + translation[1] - c * ox - d * oy
+        
+        new_vertices = [(a * x + b * y + e, c * x + d * y + f)
+                        for x, y in transformed.vertices]
         
         transformed.vertices = new_vertices
         transformed.invalidate_cache()
@@ -150,10 +142,18 @@ class Circle(Geometry):
     Geometría de círculo
     """
     
-    def __init__(self, center: Tuple[float, float] = (0, 0), radius: float = 100, segments: int = 32):
+    def __init__(self, center: Tuple[float, float] = (0, 0), radius: float = 100, segments: int = 32,
+                 unit_points: Optional[Sequence[Tuple[float, float]]] = None):
+        """
+        Args:
+            unit_points: Plantilla de círculo unitario ya calculada (ver
+                unit_circle_points); permite crear muchos círculos sin repetir
+                la trigonometría
+        """
         super().__init__()
         self.circle_center = center
         self.radius = radius
+        self._r2 = radius * radius  # Radio al cuadrado, usado por área y contains_point
         self.segments = max(3, segments)  # Mínimo 3 segmentos
         self.properties = {
             'type': 'circle',
@@ -161,28 +161,55 @@ class Circle(Geometry):
             'radius': radius,
             'segments': segments
         }
-        self._generate_vertices()
+        
+        # Los vértices se generan la primera vez que se piden: área, perímetro,
+        # bbox y SVG son analíticos y no los necesitan
+        self._unit_points = unit_points
+        self._invalidate_vertices()
     
-    def _generate_vertices(self):
+    @property
+    def vertices(self) -> List[Tuple[float, float]]:
+        """Vértices del círculo (generados bajo demanda)"""
+        if self._vertices is None:
+            self._generate_vertices(self._unit_points)
+        return self._vertices
+    
+    @vertices.setter
+    def vertices(self, value: List[Tuple[float, float]]):
+        self._vertices = value
+    
+    @property
+    def edges(self) -> List[Tuple[int, int]]:
+        """Aristas del círculo (generadas bajo demanda)"""
+        if self._edges is None:
+            self._generate_vertices(self._unit_points)
+        return self._edges
+    
+    @edges.setter
+    def edges(self, value: List[Tuple[int, int]]):
+        self._edges = value
+    
+    def _invalidate_vertices(self):
+        """Descarta los vértices generados; se regenerarán al pedirlos"""
+        self._vertices = None
+        self._edges = None
+        self.invalidate_cache()
+    
+    def _generate_vertices(self, unit_points: Optional[Sequence[Tuple[float, float]]] = None):
         """Genera los vértices del círculo"""
-        self.vertices = []
-        self.edges = []
-        
         cx, cy = self.circle_center
+        r = self.radius
+        segments = self.segments
         
-        # Generar vértices
-        for i in range(self.segments):
-            angle = 2 * math.pi * i / self.segments
-            x = cx + self.radius * math.cos(angle)
-            y = cy + self.radius * math.sin(angle)
-            self.vertices.append((x, y))
+        if unit_points is None:
+            unit_points = unit_circle_points(segments)
         
-        # Generar edges (conexiones entre vértices)
-        for i in range(self.segments):
-            next_i = (i + 1) % self.segments
-            self.edges.append((i, next_i))
+        # Generar vértices escalando la plantilla unitaria; ambas listas se
+        # construyen de una vez con su tamaño final, sin append
+        self._vertices = [(cx + r * ux, cy + r * uy) for ux, uy in unit_points]
         
-        self.invalidate_cache()
+        # Generar edges (conexiones entre vértices, cerrando el anillo)
+        self._edges = [(i, (i + 1) % segments) for i in range(segments)]
     
     def get_svg_path(self) -> str:
         """Retorna el path SVG del círculo"""
@@ -200,12 +227,66 @@ class Circle(Geometry):
     
     def calculate_area(self) -> float:
         """Calcula el área del círculo"""
-        return math.pi * self.radius * self.radius
+        return math.pi * self._r2
     
     def calculate_perimeter(self) -> float:
         """Calcula el perímetro del círculo"""
         return 2 * math.pi * self.radius
     
+    def get_coordinate_arrays(self) -> Tuple[array, array]:
+        """
+        Coordenadas de los vértices como dos arrays contiguos de doubles (xs, ys).
+        Si los vértices aún no existen se calculan desde la plantilla unitaria,
+        sin crear una tupla por vértice.
+        """
+        if self._vertices is not None:
+            # Vértices ya generados o asignados (p. ej. tras transform())
+            return (array('d', [x for x, _ in self._vertices]),
+                    array('d', [y for _, y in self._vertices]))
+        
+        cx, cy = self.circle_center
+        r = self.radius
+        unit_points = self._unit_points or unit_circle_points(self.segments)
+        xs = array('d', [cx + r * ux for ux, _ in unit_points])
+        ys = array('d', [cy + r * uy for _, uy in unit_points])
+        return xs, ys
+    
+    def contains_point(self, x: float, y: float) -> bool:
+        """Verifica si un punto está dentro del círculo"""
+        cx, cy = self.circle_center
+        dx = x - cx
+        dy = y - cy
+        return dx * dx + dy * dy <= self._r2
+    
+    def contains_points(self, xs: Sequence[float], ys: Sequence[float]) -> List[bool]:
+        """Versión por lotes de contains_point para muchos puntos (p. ej. rasterizado)"""
+        cx, cy = self.circle_center
+        r2 = self._r2
+        return [(x - cx) * (x - cx) + (y - cy) * (y - cy) <= r2 for x, y in zip(xs, ys)]
+    
+    def transform(self, translation: Tuple[float, float] = (0, 0), 
+                  rotation: float = 0, scale: Tuple[float, float] = (1, 1),
+                  origin: Optional[Tuple[float, float]] = None) -> 'Geometry':
+        """
+        Aplica transformaciones al círculo. Si solo hay traslación y escala
+        uniforme positiva, el resultado sigue siendo un círculo: se mueve el
+        centro y se escala el radio, reutilizando la plantilla unitaria sin
+        tocar los vértices. En otro caso se usa la transformación general.
+        """
+        sx, sy = scale
+        if rotation != 0 or sx != sy or sx <= 0:
+            return super().transform(translation, rotation, scale, origin)
+        
+        cx, cy = self.circle_center
+        if origin is None:
+            ox, oy = cx, cy
+        else:
+            ox, oy = origin
+        
+        center = (ox + (cx - ox) * sx + translation[0],
+                  oy + (cy - oy) * sx + translation[1])
+        return Circle(center, self.radius * sx, self.segments, self._unit_points)
+    
     def copy(self) -> 'Circle':
         """Crea una copia del círculo"""
         return Circle(self.circle_center, self.radius, self.segments)
@@ -213,20 +294,22 @@ class Circle(Geometry):
     def set_radius(self, radius: float):
         """Cambia el radio del círculo"""
         self.radius = max(0, radius)
+        self._r2 = self.radius * self.radius
         self.properties['radius'] = self.radius
-        self._generate_vertices()
+        self._invalidate_vertices()
     
     def set_center(self, center: Tuple[float, float]):
         """Cambia el centro del círculo"""
         self.circle_center = center
         self.properties['center'] = center
-        self._generate_vertices()
+        self._invalidate_vertices()
     
     def set_segments(self, segments: int):
         """Cambia el número de segmentos"""
         self.segments = max(3, segments)
         self.properties['segments'] = self.segments
-        self._generate_vertices()
+        self._unit_points = None
+        self._invalidate_vertices()
 
 class Rectangle(Geometry):
     """
@@ -350,41 +433,29 @@ class Polygon(Geometry):
         if not self.vertices:
             return (0, 0, 0, 0)
         
-        xs = [x for x, y in self.vertices]
-        ys = [y for x, y in self.vertices]
+        xs, ys = zip(*self.vertices)
         
         return (min(xs), min(ys), max(xs), max(ys))
     
     def calculate_area(self) -> float:
         """Calcula el área del polígono usando la fórmula del shoelace"""
-        if len(self.vertices) < 3:
+        vertices = self.vertices
+        if len(vertices) < 3:
             return 0.0
         
-        area = 0.0
-        n = len(self.vertices)
-        
-        for i in range(n):
-            j = (i + 1) % n
-            area += self.vertices[i][0] * self.vertices[j][1]
-            area -= self.vertices[j][0] * self.vertices[i][1]
+        # Cada vértice emparejado con el siguiente (cerrando el polígono)
+        area = sum(x0 * y1 - x1 * y0
+                   for (x0, y0), (x1, y1) in zip(vertices, vertices[1:] + vertices[:1]))
         
         return abs(area) / 2.0
     
     def calculate_perimeter(self) -> float:
         """Calcula el perímetro del polígono"""
-        if len(self.vertices) < 2:
+        vertices = self.vertices
+        if len(vertices) < 2:
             return 0.0
         
-        perimeter = 0.0
-        n = len(self.vertices)
-        
-        for i in range(n):
-            j = (i + 1) % n
-            dx = self.vertices[j][0] - self.vertices[i][0]
-            dy = self.vertices[j][1] - self.vertices[i][1]
-            perimeter += math.sqrt(dx * dx + dy * dy)
-        
-        return perimeter
+        return sum(map(math.dist, vertices, vertices[1:] + vertices[:1]))
     
     def copy(self) -> 'Polygon':
         """Crea una copia del polígono"""
@@ -404,6 +475,21 @@ class CompositeGeometry(Geometry):
         }
         self._update_vertices()
     
+    @classmethod
+    def merge_many(cls, geometries: List[Geometry]) -> 'CompositeGeometry':
+        """
+        Combina varias geometrías en un solo compuesto de una pasada.
+        Los compuestos de entrada se aplanan para no anidar merges encadenados.
+        """
+        flat_geometries = []
+        for geometry in geometries:
+            if isinstance(geometry, CompositeGeometry):
+                flat_geometries.extend(geometry.geometries)
+            else:
+                flat_geometries.append(geometry)
+        
+        return cls(flat_geometries)
+    
     def _update_vertices(self):
         """Actualiza vértices y aristas basado en las geometrías componentes"""
         self.vertices = []
@@ -483,6 +569,17 @@ def distance_between_points(p1: Tuple[float, float], p2: Tuple[float, float]) ->
     dy = p2[1] - p1[1]
     return math.sqrt(dx * dx + dy * dy)
 
+@lru_cache(maxsize=257)
+def unit_circle_points(segments: int) -> Tuple[Tuple[float, float], ...]:
+    """
+    Puntos (cos, sin) de un círculo unitario dividido en segmentos.
+    Se cachea por número de segmentos (3-256 en la práctica), así que la
+    trigonometría se calcula una sola vez para todos los círculos.
+    """
+    step = 2 * math.pi / segments
+    cos, sin = math.cos, math.sin
+    return tuple([(cos(i * step), sin(i * step)) for i in range(segments)])
+
 def angle_between_points(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """Calcula el ángulo entre dos puntos en radianes"""
     dx = p2[0] - p1[0]
@@ -523,15 +620,10 @@ def scale_point(point: Tuple[float, float], scale: Tuple[float, float],
 def create_regular_polygon(center: Tuple[float, float], radius: float, 
                           sides: int) -> Polygon:
     """Crea un polígono regular"""
-    vertices = []
-    
-    for i in range(sides):
-        angle = 2 * math.pi * i / sides
-        x = center[0] + radius * math.cos(angle)
-        y = center[1] + radius * math.sin(angle)
-        vertices.append((x, y))
-    
-    return Polygon(vertices)
+    # Reutiliza la plantilla unitaria cacheada en vez de recalcular cos/sin
+    cx, cy = center
+    return Polygon([(cx + radius * ux, cy + radius * uy)
+                    for ux, uy in unit_circle_points(sides)])
 
 def create_star(center: Tuple[float, float], outer_radius: float, 
                inner_radius: float, points: int) -> Polygon: